@@ -0,0 +1,126 @@
+"""
+Benchmark serial vs batched Gmail message fetches against a local stub
+
+The stub Gmail service sleeps for one simulated network round-trip per
+execute(), so the timings show how each fetch path scales with the
+number of messages without touching the real API.
+
+Usage:
+    python benchmarks/gmail_batch_benchmark.py [--rtt-ms 40] [--counts 10 50 200]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.integrations.google_client import GoogleClient, BATCH_SIZE
+
+
+def fake_message(message_id):
+    return {
+        'id': message_id,
+        'internalDate': '0',
+        'labelIds': ['INBOX'],
+        'snippet': f"Snippet for {message_id}",
+        'payload': {
+            'mimeType': 'text/plain',
+            'headers': [
+                {'name': 'Subject', 'value': f"Subject {message_id}"},
+                {'name': 'From', 'value': 'sender@example.com'},
+                {'name': 'Date', 'value': 'Mon, 1 Jan 2024 09:00:00 +0000'},
+            ],
+            'body': {'data': 'SGVsbG8gd29ybGQ='},
+        },
+    }
+
+
+class StubRequest:
+    def __init__(self, service, message_id):
+        self.service = service
+        self.message_id = message_id
+
+    def execute(self):
+        self.service.round_trips += 1
+        time.sleep(self.service.rtt)
+        return fake_message(self.message_id)
+
+
+class StubBatch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        # One round-trip carries every request in the batch.
+        self.service.round_trips += 1
+        time.sleep(self.service.rtt)
+        for request_id, request in self.requests:
+            self.callback(request_id, fake_message(request.message_id), None)
+
+
+class StubGmailService:
+    """Just enough of the Gmail resource for batch_get_messages and the serial baseline"""
+
+    def __init__(self, rtt):
+        self.rtt = rtt
+        self.round_trips = 0
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, userId, id, format='full', metadataHeaders=None):
+        return StubRequest(self, id)
+
+    def new_batch_http_request(self, callback=None):
+        return StubBatch(self, callback)
+
+
+class StubGoogleClient(GoogleClient):
+    def __init__(self, service):
+        super().__init__()
+        self._stub_service = service
+
+    @property
+    def gmail_service(self):
+        return self._stub_service
+
+
+def fetch_serial(client, message_ids):
+    """The pre-batching path: one messages().get round-trip per message"""
+    return {
+        message_id: client.gmail_service.users().messages().get(userId='me', id=message_id).execute()
+        for message_id in message_ids
+    }
+
+
+def run(counts, rtt):
+    print(f"Simulated round-trip: {rtt * 1000:.0f} ms, batch size: {BATCH_SIZE}")
+    print(f"{'messages':>8} {'path':>8} {'round-trips':>12} {'seconds':>9}")
+    for count in counts:
+        message_ids = [f"m{i}" for i in range(count)]
+        for name, fetch in (("serial", fetch_serial), ("batched", GoogleClient.batch_get_messages)):
+            service = StubGmailService(rtt)
+            client = StubGoogleClient(service)
+            started = time.perf_counter()
+            details = fetch(client, message_ids)
+            elapsed = time.perf_counter() - started
+            assert len(details) == count
+            print(f"{count:>8} {name:>8} {service.round_trips:>12} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serial vs batched Gmail fetch benchmark")
+    parser.add_argument("--rtt-ms", type=float, default=40, help="Simulated network round-trip in ms")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200],
+                        help="Message counts to benchmark")
+    args = parser.parse_args()
+    run(args.counts, args.rtt_ms / 1000)
@@ -1,19 +1,23 @@
 import os
 import sys
 import json
+import asyncio
 import schedule
 import time
 from datetime import datetime
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.agents.workflow import run_personal_assistant
+from src.agents.workflow import run_personal_assistant, arun_personal_assistant
 from src.api.jira_endpoints import router as jira_router
 from src.api.gmail_endpoints import router as gmail_router
 from src.api.calendar_endpoints import router as calendar_router
 from src.api.slack_endpoints import router as slack_router
+from src.api.slack_events_endpoints import router as slack_events_router
 from fastapi.responses import JSONResponse
 from src.api.unified_endpoints import router as unified_router
+from src.helpers.llm_cache import get_llm_cache
+from src.helpers.prompt_compactor import compactor
 import traceback
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -38,6 +42,7 @@ app.include_router(jira_router)
 app.include_router(gmail_router)
 app.include_router(calendar_router)
 app.include_router(slack_router)
+app.include_router(slack_events_router)
 app.include_router(unified_router)
 
 
@@ -47,35 +52,49 @@ def generate_daily_summary():
     print(f"Generating daily summary at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
-        result = run_personal_assistant()
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")        
-        
-        json_file = output_dir / f"daily_summary_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=4)
-        
-        with open(json_file, "r", encoding="utf-8") as f:
-            json_content = json.load(f)
-        
-        return json_content
-        
+        return _save_summary(run_personal_assistant())
     except Exception as e:
-        error_message = f"Error generating daily summary: {str(e)}"
-        print(error_message)
-        traceback.print_exc()
-        
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        error_file = output_dir / f"error_log_{timestamp}.txt"
+        return _save_error(e)
+
+async def agenerate_daily_summary():
+    """Generate the daily summary with the async workflow and save it to a file
+    """
+    print(f"Generating daily summary at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    try:
+        return _save_summary(await arun_personal_assistant())
+    except Exception as e:
+        return _save_error(e)
+
+def _save_summary(result):
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")        
+    
+    json_file = output_dir / f"daily_summary_{timestamp}.json"
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4)
+    
+    with open(json_file, "r", encoding="utf-8") as f:
+        json_content = json.load(f)
+    
+    return json_content
+
+def _save_error(e):
+    error_message = f"Error generating daily summary: {str(e)}"
+    print(error_message)
+    traceback.print_exc()
+    
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    error_file = output_dir / f"error_log_{timestamp}.txt"
+    
+    with open(error_file, "w", encoding="utf-8") as f:
+        f.write(error_message)
         
-        with open(error_file, "w", encoding="utf-8") as f:
-            f.write(error_message)
-            
-        return error_message
+    return error_message
 
 def schedule_daily_summary(hour=8, minute=30):
     """Schedule the daily summary to run at a specific time
@@ -92,12 +111,29 @@ async def run_once():
     """Run the daily summary once
     
     """
-    result = generate_daily_summary()
+    result = await agenerate_daily_summary()
     if isinstance(result, dict):
         return JSONResponse(content=result)
     else:
         return JSONResponse(content={"error": result}, status_code=500)
 
+@app.get("/llm_cache/stats")
+async def llm_cache_stats():
+    """Hit/miss counters and size of the LLM response cache
+    
+    """
+    cache = get_llm_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.get_stats()}
+
+@app.get("/prompt_compaction/stats")
+async def prompt_compaction_stats():
+    """Estimated prompt tokens before and after compaction, per item kind
+    
+    """
+    return compactor.get_stats()
+
 if __name__ == "__main__":
     import argparse
     
@@ -117,7 +153,7 @@ if __name__ == "__main__":
         print(f"Starting Personal Assistant - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*80 + "\n")
         
-        summary = run_once()
+        summary = asyncio.run(agenerate_daily_summary())
         
         print("\n" + "="*80 + "\n")
         print(summary)
@@ -1,8 +1,11 @@
 import sys
 import os
-from datetime import datetime, timedelta
+import asyncio
 from src.integrations.google_client import GoogleClient
 from src.helpers.llm_client import GeminiClient
+from src.helpers.schedule_analysis import analyze_schedule
+from src.helpers.incremental_summarizer import IncrementalSummarizer
+from src.models.work_item import WorkItem
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 
@@ -10,13 +13,16 @@ class CalendarAgent:
     def __init__(self):
         self.google_client = GoogleClient()
         self.llm_client = GeminiClient()
+        self.summarizer = IncrementalSummarizer(self.llm_client)
         
-    def run(self, days_ahead=2):
+    def run(self, days_ahead=2, incremental=True):
         """
         Run calendar agent to collect and analyze calendar events
         
         Args:
             days_ahead (int): Number of days to look ahead
+            incremental (bool): Merge changed events into the previous summary
+                instead of re-summarizing every event
             
         Returns:
             dict: Calendar events data and summary
@@ -24,21 +30,64 @@ class CalendarAgent:
         try:
             print("📅 Calendar Agent: Retrieving upcoming meetings...")
             
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                        
-            events = self.google_client.get_todays_events()
+            events = self._get_events(days_ahead)
             
             if not events or len(events) == 0:
                 return {"summary": "No upcoming meetings found.", "events": []}
             
-            summary = self.llm_client.summarize_meetings(events)
+            schedule = analyze_schedule(events)
+            if incremental:
+                summary = self.summarizer.summarize(
+                    "meetings", events, self.llm_client.summarize_meetings, schedule_facts=schedule
+                )
+            else:
+                summary = self.llm_client.summarize_meetings(events, schedule_facts=schedule)
             
             return {
                 "summary": summary,
-                "events": events
+                "events": events,
+                "schedule": schedule
             }
         
         except Exception as e:
             error_msg = f"Error in Calendar Agent: {str(e)}"
             print(error_msg)
             return {"summary": error_msg, "events": []}
+
+    async def arun(self, days_ahead=2, incremental=True):
+        """
+        Async variant of run: events are fetched in a worker thread and the
+        summary is awaited without blocking the event loop
+        """
+        try:
+            print("📅 Calendar Agent: Retrieving upcoming meetings...")
+            
+            events = await asyncio.to_thread(self._get_events, days_ahead)
+            
+            if not events:
+                return {"summary": "No upcoming meetings found.", "events": []}
+            
+            schedule = analyze_schedule(events)
+            if incremental:
+                summary = await self.summarizer.asummarize(
+                    "meetings", events, self.llm_client.asummarize_meetings, schedule_facts=schedule
+                )
+            else:
+                summary = await self.llm_client.asummarize_meetings(events, schedule_facts=schedule)
+            
+            return {
+                "summary": summary,
+                "events": events,
+                "schedule": schedule
+            }
+        
+        except Exception as e:
+            error_msg = f"Error in Calendar Agent: {str(e)}"
+            print(error_msg)
+            return {"summary": error_msg, "events": []}
+
+    def _get_events(self, days_ahead):
+        return [
+            WorkItem.from_event(event)
+            for event in self.google_client.get_upcoming_events(days_ahead=days_ahead)
+        ]
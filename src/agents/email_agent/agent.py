@@ -1,23 +1,30 @@
 import sys
 import os
+import asyncio
+from itertools import chain
 from src.integrations.google_client import GoogleClient
 from src.helpers.llm_client import GeminiClient
+from src.models.work_item import WorkItem
+from src.helpers.incremental_summarizer import IncrementalSummarizer
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 
 class EmailAgent:
     def __init__(self):
-        self.google_client = GoogleClient()
+        self.google_client = GoogleClient(metadata_first=True)
         self.llm_client = GeminiClient()
+        self.summarizer = IncrementalSummarizer(self.llm_client)
         
-    def run(self, max_results=20):
+    def run(self, max_results=100, incremental=True):
         """
         Run email agent to collect and analyze email data
         
         Args:
-            top (int): Maximum number of emails to retrieve
-            days (int): Number of days to look back
+            max_results (int): Maximum number of emails to retrieve
+            incremental (bool): Read from the locally synced store instead of
+                re-downloading the whole day, and merge new or changed emails
+                into the previous summary
             
         Returns:
             dict: Email data and summary
@@ -25,12 +32,25 @@ class EmailAgent:
         try:
             print("📧 Email Agent: Retrieving recent emails from Gmail...")
             
-            emails = self.google_client.get_todays_emails(max_results=max_results)
+            stream = self._iter_emails(max_results, incremental)
             
-            if not emails:
+            first = next(stream, None)
+            if first is None:
                 return {"summary": "No recent emails found.", "emails": []}
+            
+            if incremental:
+                emails = [WorkItem.from_email(email) for email in chain([first], stream)]
+                summary = self.summarizer.summarize("emails", emails, self.llm_client.summarize_emails)
+            else:
+                emails = []
+                
+                def collect(items):
+                    for email in items:
+                        item = WorkItem.from_email(email)
+                        emails.append(item)
+                        yield item
                 
-            summary = self.llm_client.summarize_emails(emails)
+                summary = self.llm_client.summarize_emails(collect(chain([first], stream)))
             
             return {
                 "summary": summary,
@@ -41,6 +61,40 @@ class EmailAgent:
             error_msg = f"Error in Email Agent: {str(e)}"
             print(error_msg)
             return {"summary": error_msg, "emails": []}
+
+    async def arun(self, max_results=100, incremental=True):
+        """
+        Async variant of run: emails are fetched in a worker thread and the
+        summary is awaited without blocking the event loop
+        """
+        try:
+            print("📧 Email Agent: Retrieving recent emails from Gmail...")
+            
+            emails = await asyncio.to_thread(
+                lambda: [WorkItem.from_email(email) for email in self._iter_emails(max_results, incremental)]
+            )
+            if not emails:
+                return {"summary": "No recent emails found.", "emails": []}
+            
+            if incremental:
+                summary = await self.summarizer.asummarize("emails", emails, self.llm_client.asummarize_emails)
+            else:
+                summary = await self.llm_client.asummarize_emails(emails)
+            
+            return {
+                "summary": summary,
+                "emails": emails
+            }
+        
+        except Exception as e:
+            error_msg = f"Error in Email Agent: {str(e)}"
+            print(error_msg)
+            return {"summary": error_msg, "emails": []}
+
+    def _iter_emails(self, max_results, incremental):
+        if incremental:
+            return self.google_client.iter_synced_emails(max_results=max_results)
+        return self.google_client.iter_todays_emails(max_results=max_results)
     
     def _get_date_filter(self, days):
         """Helper to create a date filter string for MS Graph API"""
@@ -1,22 +1,31 @@
 import sys
 import os
+import asyncio
+from datetime import datetime, timedelta
+from dateutil import tz
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.integrations.jira_client import JiraClient
 from src.helpers.llm_client import GeminiClient
+from src.models.work_item import WorkItem
+from src.helpers.incremental_summarizer import IncrementalSummarizer
 
 class JiraAgent:
     def __init__(self):
         self.jira_client = JiraClient()
         self.llm_client = GeminiClient()
+        self.summarizer = IncrementalSummarizer(self.llm_client)
         
-    def run(self, days_back=7):
+    def run(self, days_back=7, incremental=True):
         """
         Run JIRA agent to collect and analyze JIRA tickets
         
         Args:
             days_back (int): Number of days to look back for JIRA tickets
+            incremental (bool): Sync changed issues into the local store and
+                read from it instead of re-querying the whole window, and merge
+                new or changed issues into the previous summary
             
         Returns:
             dict: JIRA issues data and summary
@@ -24,23 +33,44 @@ class JiraAgent:
         try:
             print("🎫 JIRA Agent: Retrieving assigned tickets...")
             
-            assigned_issues = self.jira_client.get_assigned_issues(days_back=days_back)
+            issues_list = self._get_issues(days_back, incremental)
             
-            created_issues = self.jira_client.get_created_issues(days_back=days_back)
+            if not issues_list:
+                return {"summary": "No recent JIRA activity found.", "issues": []}
             
-            updated_issues = self.jira_client.get_updated_issues(days_back=days_back)
+            if incremental:
+                summary = self.summarizer.summarize("jira", issues_list, self.llm_client.summarize_jira_tickets)
+            else:
+                summary = self.llm_client.summarize_jira_tickets(issues_list)
             
-            all_issues = {}
-            for issue in list(assigned_issues) + list(created_issues) + list(updated_issues):
-                if issue.key not in all_issues:
-                    all_issues[issue.key] = issue
+            return {
+                "summary": summary,
+                "issues": issues_list
+            }
+        except Exception as e:
+            error_msg = f"Error in JIRA Agent: {str(e)}"
+            print(error_msg)
+            return {"summary": error_msg, "issues": []}
+
+    async def arun(self, days_back=7, incremental=True):
+        """
+        Async variant of run: issues are fetched in a worker thread and the
+        summary is awaited without blocking the event loop
+        """
+        try:
+            print("🎫 JIRA Agent: Retrieving assigned tickets...")
             
-            issues_list = list(all_issues.values())
+            issues_list = await asyncio.to_thread(self._get_issues, days_back, incremental)
             
             if not issues_list:
                 return {"summary": "No recent JIRA activity found.", "issues": []}
             
-            summary = self.llm_client.summarize_jira_tickets(issues_list)
+            if incremental:
+                summary = await self.summarizer.asummarize(
+                    "jira", issues_list, self.llm_client.asummarize_jira_tickets
+                )
+            else:
+                summary = await self.llm_client.asummarize_jira_tickets(issues_list)
             
             return {
                 "summary": summary,
@@ -50,3 +80,14 @@ class JiraAgent:
             error_msg = f"Error in JIRA Agent: {str(e)}"
             print(error_msg)
             return {"summary": error_msg, "issues": []}
+
+    def _get_issues(self, days_back, incremental):
+        if incremental:
+            records = self.jira_client.get_synced_issues(days_back=days_back)
+        else:
+            since = datetime.now(tz.UTC) - timedelta(days=days_back)
+            records = [
+                self.jira_client.to_record(issue, since=since)
+                for issue in self.jira_client.get_recent_issues(days_back=days_back)
+            ]
+        return [WorkItem.from_jira_record(record) for record in records]
@@ -1,24 +1,33 @@
 import sys
 import os
+import asyncio
 from src.integrations.slack_client import SlackClient
 from src.helpers.llm_client import GeminiClient
+from src.models.work_item import WorkItem
+from src.helpers.incremental_summarizer import IncrementalSummarizer
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
+# "events" reads only the log filled by the Events API endpoint; "poll" syncs channel histories.
+SLACK_INGESTION_MODE = os.environ.get("SLACK_INGESTION_MODE", "poll")
 
 
 class SlackAgent:
     def __init__(self):
         self.slack_client = SlackClient(bot_token=SLACK_BOT_TOKEN)
         self.llm_client = GeminiClient()
+        self.summarizer = IncrementalSummarizer(self.llm_client)
         
-    def run(self, top=20):
+    def run(self, top=20, incremental=True):
         """
         Run Slack agent to collect and analyze Slack messages
         
         Args:
             top (int): Maximum number of messages to retrieve
+            incremental (bool): Sync new messages into the local log and read
+                the day back from it instead of re-reading every channel, and
+                merge new or changed messages into the previous summary
             
         Returns:
             dict: Slack messages data and summary
@@ -26,12 +35,45 @@ class SlackAgent:
         try:
             print("💬 Slack Agent: Retrieving recent messages...")
             
-            messages = self.slack_client.get_todays_messages()
+            messages = self._get_messages(incremental)
+            
+            if not messages:
+                return {"summary": "No recent Slack messages found.", "messages": []}
+            
+            if incremental:
+                summary = self.summarizer.summarize("slack", messages, self.llm_client.summarize_slack_messages)
+            else:
+                summary = self.llm_client.summarize_slack_messages(messages)
+            
+            return {
+                "summary": summary,
+                "messages": messages
+            }
+        
+        except Exception as e:
+            error_msg = f"Error in Slack Agent: {str(e)}"
+            print(error_msg)
+            return {"summary": error_msg, "messages": []}
+
+    async def arun(self, top=20, incremental=True):
+        """
+        Async variant of run: messages are fetched in a worker thread and the
+        summary is awaited without blocking the event loop
+        """
+        try:
+            print("💬 Slack Agent: Retrieving recent messages...")
+            
+            messages = await asyncio.to_thread(self._get_messages, incremental)
             
-            if not messages or len(messages) == 0:
+            if not messages:
                 return {"summary": "No recent Slack messages found.", "messages": []}
             
-            summary = self.llm_client.summarize_slack_messages(messages)
+            if incremental:
+                summary = await self.summarizer.asummarize(
+                    "slack", messages, self.llm_client.asummarize_slack_messages
+                )
+            else:
+                summary = await self.llm_client.asummarize_slack_messages(messages)
             
             return {
                 "summary": summary,
@@ -42,3 +84,12 @@ class SlackAgent:
             error_msg = f"Error in Slack Agent: {str(e)}"
             print(error_msg)
             return {"summary": error_msg, "messages": []}
+
+    def _get_messages(self, incremental):
+        if SLACK_INGESTION_MODE == "events":
+            messages = self.slack_client.get_stored_messages()
+        elif incremental:
+            messages = self.slack_client.get_synced_messages()
+        else:
+            messages = self.slack_client.get_todays_messages()
+        return [WorkItem.from_slack_message(message) for message in messages or []]
@@ -19,8 +19,12 @@ class AgentState(TypedDict):
     todo_list: Optional[str]
     error: Optional[str]
 
-def create_personal_assistant_workflow():
+def create_personal_assistant_workflow(use_async=False):
     """Create the langgraph workflow for the personal assistant
+    
+    Args:
+        use_async (bool): Register async nodes that await the agents' arun
+            methods; the compiled graph must then be run with ainvoke
     """
     
     workflow = StateGraph(AgentState)
@@ -103,12 +107,50 @@ def create_personal_assistant_workflow():
         except Exception as e:
             return {"error": f"Error in summary agent: {str(e)}"}
     
+    # Async nodes, used when the graph runs with ainvoke
+    async def aemail_agent(state: AgentState) -> AgentState:
+        try:
+            return {"email_data": await EmailAgent().arun()}
+        except Exception as e:
+            return {"email_error": f"Error in email agent: {str(e)}"}
+
+    async def acalendar_agent(state: AgentState) -> AgentState:
+        try:
+            return {"calendar_data": await CalendarAgent().arun(days_ahead=2)}
+        except Exception as e:
+            return {"calendar_error": f"Error in calendar agent: {str(e)}"}
+
+    async def aslack_agent(state: AgentState) -> AgentState:
+        try:
+            return {"slack_data": await SlackAgent().arun(top=20)}
+        except Exception as e:
+            return {"slack_error": f"Error in slack agent: {str(e)}"}
+
+    async def ajira_agent(state: AgentState) -> AgentState:
+        try:
+            return {"jira_data": await JiraAgent().arun(days_back=7)}
+        except Exception as e:
+            return {"jira_error": f"Error in JIRA agent: {str(e)}"}
+
+    async def asummary_agent(state: AgentState) -> AgentState:
+        try:
+            llm_client = GeminiClient()
+            todo_list = await llm_client.acreate_todo_list(
+                email_summary=state.get("email_data", {}).get("summary", "No email data available."),
+                meetings_summary=state.get("calendar_data", {}).get("summary", "No calendar data available."),
+                jira_summary=state.get("jira_data", {}).get("summary", "No JIRA data available."),
+                slack_summary=state.get("slack_data", {}).get("summary", "No Slack data available.")
+            )
+            return {"todo_list": todo_list}
+        except Exception as e:
+            return {"error": f"Error in summary agent: {str(e)}"}
+    
     # Add nodes to the workflow
-    workflow.add_node("email_agent", email_agent)
-    workflow.add_node("calendar_agent", calendar_agent)
-    workflow.add_node("slack_agent", slack_agent)
-    workflow.add_node("jira_agent", jira_agent)
-    workflow.add_node("summary_agent", summary_agent)
+    workflow.add_node("email_agent", aemail_agent if use_async else email_agent)
+    workflow.add_node("calendar_agent", acalendar_agent if use_async else calendar_agent)
+    workflow.add_node("slack_agent", aslack_agent if use_async else slack_agent)
+    workflow.add_node("jira_agent", ajira_agent if use_async else jira_agent)
+    workflow.add_node("summary_agent", asummary_agent if use_async else summary_agent)
     
     workflow.add_edge("email_agent", "summary_agent")
     workflow.add_edge("calendar_agent", "summary_agent")
@@ -129,8 +171,25 @@ def run_personal_assistant() -> Dict[str, Any]:
     
     executor = create_personal_assistant_workflow()
     
-    # Define the initial state
-    initial_state = {
+    # Execute the workflow
+    print("Starting personal assistant workflow...")
+    result = executor.invoke(_initial_state())
+    
+    return _format_result(result)
+
+async def arun_personal_assistant() -> Dict[str, Any]:
+    """Run the workflow as a fully async graph and return the results
+    """
+    
+    executor = create_personal_assistant_workflow(use_async=True)
+    
+    print("Starting personal assistant workflow (async)...")
+    result = await executor.ainvoke(_initial_state())
+    
+    return _format_result(result)
+
+def _initial_state() -> Dict[str, Any]:
+    return {
         "email_data": None,
         "calendar_data": None,
         "slack_data": None,
@@ -138,11 +197,8 @@ def run_personal_assistant() -> Dict[str, Any]:
         "todo_list": None,
         "error": None,
     }
-    
-    # Execute the workflow
-    print("Starting personal assistant workflow...")
-    result = executor.invoke(initial_state)
-    
+
+def _format_result(result: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "email_summary": result.get("email_data", {}).get("summary", "No email data available."),
         "calendar_summary": result.get("calendar_data", {}).get("summary", "No calendar data available."),
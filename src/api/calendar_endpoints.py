@@ -1,5 +1,6 @@
 import os
 from fastapi import APIRouter, HTTPException, Body
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from pydantic import BaseModel
 from langchain_core.messages import HumanMessage
@@ -9,10 +10,8 @@ from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
 from dotenv import load_dotenv
 from langfuse import observe
-from langchain_google_community.calendar.utils import (
-    build_resource_service,
-    get_google_credentials,
-)
+from src.integrations.google_services import get_service, CALENDAR_FULL_SCOPE
+from src.integrations.google_client import GoogleClient
 
 load_dotenv()
 
@@ -35,16 +34,15 @@ router = APIRouter(
 
 memory = MemorySaver()
 
-credentials = get_google_credentials(
-    token_file="token.json",
-    scopes=["https://www.googleapis.com/auth/calendar"],
-    client_secrets_file="src/config/credentials.json",
-)
-
-api_resource = build_resource_service(credentials=credentials)
-toolkit = CalendarToolkit(api_resource=api_resource)
+_tools = None
 
-tools = toolkit.get_tools()
+def get_tools():
+    """Build the Calendar toolkit on first use from the shared service registry"""
+    global _tools
+    if _tools is None:
+        api_resource = get_service("calendar", "v3", [CALENDAR_FULL_SCOPE])
+        _tools = CalendarToolkit(api_resource=api_resource).get_tools()
+    return _tools
 
 def get_agent_executor(model_name=DEFAULT_MODEL_NAME):
     llm = AzureChatOpenAI(
@@ -56,7 +54,7 @@ def get_agent_executor(model_name=DEFAULT_MODEL_NAME):
     )
     return create_react_agent(
         llm,
-        tools,
+        get_tools(),
         checkpointer=memory
     )
 
@@ -97,6 +95,18 @@ async def query_calendar(calendar_query: CalendarQuery = Body(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing Calendar query: {str(e)}")
 
+@router.get("/events")
+async def get_events(days_ahead: int = 1, timezone: Optional[str] = None):
+    """List events from today through days_ahead days, served from the local event store"""
+    try:
+        # The Calendar sync and store read block, so keep them off the event loop.
+        events = await run_in_threadpool(
+            lambda: GoogleClient().get_upcoming_events(days_ahead=days_ahead, timezone=timezone)
+        )
+        return {"days_ahead": days_ahead, "events": events}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving calendar events: {str(e)}")
+
 @router.get("/conversation/{thread_id}")
 async def get_conversation(thread_id: str):
     try:
@@ -9,10 +9,7 @@ from langgraph.checkpoint.memory import MemorySaver
 from langchain_openai import AzureChatOpenAI
 from dotenv import load_dotenv
 from langfuse import observe
-from langchain_google_community.gmail.utils import (
-    build_resource_service,
-    get_gmail_credentials,
-)
+from src.integrations.google_services import get_service, GMAIL_FULL_SCOPE
 
 load_dotenv()
 
@@ -35,16 +32,15 @@ router = APIRouter(
 
 memory = MemorySaver()
 
-credentials = get_gmail_credentials(
-    token_file="token.json",
-    scopes=["https://mail.google.com/"],
-    client_secrets_file="src/config/credentials.json",
-)
-
-api_resource = build_resource_service(credentials=credentials)
+_tools = None
 
-toolkit = GmailToolkit(api_resource=api_resource)
-tools = toolkit.get_tools()
+def get_tools():
+    """Build the Gmail toolkit on first use from the shared service registry"""
+    global _tools
+    if _tools is None:
+        api_resource = get_service("gmail", "v1", [GMAIL_FULL_SCOPE])
+        _tools = GmailToolkit(api_resource=api_resource).get_tools()
+    return _tools
 
 def get_agent_executor(model_name=DEFAULT_MODEL_NAME):
     llm = AzureChatOpenAI(
@@ -56,7 +52,7 @@ def get_agent_executor(model_name=DEFAULT_MODEL_NAME):
     )
     return create_react_agent(
         llm,
-        tools,
+        get_tools(),
         checkpointer=memory
     )
 
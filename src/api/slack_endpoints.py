@@ -9,6 +9,7 @@ from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
 from dotenv import load_dotenv
 from langfuse import observe
+from src.integrations.slack_scheduler import ScheduledWebClient, scheduler
 
 load_dotenv()
 
@@ -28,7 +29,10 @@ router = APIRouter(
 
 memory = MemorySaver()
 
-toolkit = SlackToolkit()
+slack_client = ScheduledWebClient(
+    token=os.environ.get("SLACK_USER_TOKEN") or os.environ.get("SLACK_BOT_TOKEN")
+)
+toolkit = SlackToolkit(client=slack_client)
 tools = toolkit.get_tools()
 
 def get_agent_executor():
@@ -70,6 +74,11 @@ async def query_slack(slack_query: SlackQuery = Body(...)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing Slack query: {str(e)}")
 
+@router.get("/scheduler/metrics")
+async def get_scheduler_metrics():
+    """Queue depth, in-flight calls and 429 counts per Slack API method"""
+    return {"methods": scheduler.get_metrics()}
+
 @router.get("/conversation/{thread_id}")
 async def get_conversation(thread_id: str):
     try:
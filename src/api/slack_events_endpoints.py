@@ -0,0 +1,57 @@
+import os
+import json
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from slack_sdk.signature import SignatureVerifier
+from dotenv import load_dotenv
+from src.integrations.slack_events import SlackEventIngestor
+from src.integrations.slack_scheduler import ScheduledWebClient
+
+load_dotenv()
+
+router = APIRouter(
+    prefix="/api/slack/events",
+    tags=["slack-events"],
+    responses={404: {"description": "Not found"}},
+)
+
+SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
+
+# Never verify against an empty key: anyone could sign requests with it.
+signature_verifier = SignatureVerifier(SLACK_SIGNING_SECRET) if SLACK_SIGNING_SECRET else None
+
+_ingestor = None
+
+def get_ingestor():
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = SlackEventIngestor(ScheduledWebClient(token=os.environ.get("SLACK_BOT_TOKEN")))
+    return _ingestor
+
+def ingest_event(event):
+    """Apply one event to the local Slack store after the request has been acknowledged"""
+    try:
+        get_ingestor().ingest(event)
+    except Exception as e:
+        print(f"Error ingesting Slack event: {str(e)}")
+
+@router.post("")
+async def receive_event(request: Request, background_tasks: BackgroundTasks):
+    """
+    Receive Slack Events API payloads and append messages to the local Slack store
+
+    Events are acknowledged before they are ingested: Slack redelivers any
+    event not answered within 3 seconds, and the first event may wait on a
+    full users.list load.
+    """
+    if signature_verifier is None:
+        raise HTTPException(status_code=503, detail="SLACK_SIGNING_SECRET is not configured")
+    body = await request.body()
+    if not signature_verifier.is_valid_request(body, dict(request.headers)):
+        raise HTTPException(status_code=401, detail="Invalid Slack signature")
+
+    payload = json.loads(body)
+    if payload.get("type") == "url_verification":
+        return {"challenge": payload.get("challenge")}
+    if payload.get("type") == "event_callback":
+        background_tasks.add_task(ingest_event, payload.get("event", {}))
+    return {"ok": True}
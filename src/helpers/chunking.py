@@ -0,0 +1,57 @@
+"""
+Token estimation and content-defined chunking for long LLM inputs
+"""
+import os
+import hashlib
+
+# Rough average for English text with Gemini's tokenizer.
+CHARS_PER_TOKEN = 4
+CHUNK_TOKEN_BUDGET = int(os.getenv("LLM_CHUNK_TOKENS", "6000"))
+# On average one block in this many closes a chunk.
+BOUNDARY_DIVISOR = 8
+
+
+def estimate_tokens(text):
+    """Cheap local token estimate; no tokenizer round-trip"""
+    return (len(text or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def is_boundary(block, divisor=BOUNDARY_DIVISOR):
+    """True for blocks whose content hash marks the end of a chunk"""
+    digest = hashlib.sha1(block.encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % divisor == 0
+
+
+def chunk_blocks(blocks, max_tokens=CHUNK_TOKEN_BUDGET, divisor=BOUNDARY_DIVISOR):
+    """
+    Group text blocks into chunks of at most max_tokens
+
+    Chunks end after a block whose content hash is a boundary (once the
+    chunk holds a quarter of the budget), or before a block that would not
+    fit. Because boundaries depend on content rather than position, adding
+    one block only changes the chunk it lands in, so the other chunks - and
+    any responses cached for them - stay the same.
+
+    Args:
+        blocks (list): Text blocks, one per item, in a stable order
+        max_tokens (int): Token budget per chunk; a larger block gets a chunk of its own
+        divisor (int): Average number of blocks between content boundaries
+
+    Returns:
+        list: Lists of blocks
+    """
+    min_tokens = max_tokens // 4
+    chunks, current, size = [], [], 0
+    for block in blocks:
+        tokens = estimate_tokens(block)
+        if current and size + tokens > max_tokens:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(block)
+        size += tokens
+        if size >= min_tokens and is_boundary(block, divisor):
+            chunks.append(current)
+            current, size = [], 0
+    if current:
+        chunks.append(current)
+    return chunks
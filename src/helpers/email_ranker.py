@@ -0,0 +1,67 @@
+"""
+Cheap local ranking used to decide which emails get their full body fetched
+"""
+import os
+from email.utils import getaddresses, parseaddr
+
+# Gmail category labels that mark automated or bulk traffic.
+BULK_LABELS = {'CATEGORY_PROMOTIONS', 'CATEGORY_SOCIAL', 'CATEGORY_UPDATES', 'CATEGORY_FORUMS'}
+BULK_PRECEDENCE = {'bulk', 'list', 'junk'}
+NO_REPLY_MARKERS = ('noreply', 'no-reply', 'donotreply', 'do-not-reply', 'notifications')
+
+# Headers requested in the metadata pass; enough for triage and ranking.
+METADATA_HEADERS = ['From', 'To', 'Cc', 'Subject', 'Date', 'List-Unsubscribe', 'List-Id', 'Precedence']
+
+
+class EmailRanker:
+    """Flags emails worth hydrating from their metadata alone"""
+
+    def __init__(self, user_email=None, priority_senders=None):
+        """
+        Args:
+            user_email (str, optional): The mailbox owner's address, defaults to USER_ID
+            priority_senders (list, optional): Addresses or '@domain' suffixes that are
+                always important, defaults to the comma-separated EMAIL_PRIORITY_SENDERS
+        """
+        self.user_email = (user_email or os.getenv("USER_ID", "")).lower()
+        if priority_senders is None:
+            priority_senders = os.getenv("EMAIL_PRIORITY_SENDERS", "").split(",")
+        self.priority_senders = [s.strip().lower() for s in priority_senders if s.strip()]
+
+    def is_important(self, message):
+        """
+        Decide whether a message's full body should be fetched
+
+        Args:
+            message (dict): Gmail message resource fetched with format='metadata'
+
+        Returns:
+            bool: True for priority senders and direct, non-bulk mail
+        """
+        headers = {h['name'].lower(): h['value'] for h in message.get('payload', {}).get('headers', [])}
+        labels = set(message.get('labelIds', []))
+        sender = parseaddr(headers.get('from', ''))[1].lower()
+
+        if self._is_priority_sender(sender) or 'STARRED' in labels:
+            return True
+        if self._is_bulk(headers, labels, sender):
+            return False
+        recipients = getaddresses([headers.get('to', ''), headers.get('cc', '')])
+        return not self.user_email or any(addr.lower() == self.user_email for _, addr in recipients)
+
+    def _is_priority_sender(self, sender):
+        for entry in self.priority_senders:
+            if entry.startswith('@') and sender.endswith(entry):
+                return True
+            if sender == entry:
+                return True
+        return False
+
+    def _is_bulk(self, headers, labels, sender):
+        if labels & BULK_LABELS:
+            return True
+        if 'list-unsubscribe' in headers or 'list-id' in headers:
+            return True
+        if headers.get('precedence', '').strip().lower() in BULK_PRECEDENCE:
+            return True
+        return any(marker in sender for marker in NO_REPLY_MARKERS)
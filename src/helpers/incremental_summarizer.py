@@ -0,0 +1,133 @@
+"""
+Incremental summaries: merge new or changed items into the previous summary
+"""
+import os
+import json
+import hashlib
+from datetime import date
+from src.storage.summary_store import SummaryStore
+from src.helpers.llm_client import ERROR_PREFIX
+
+# Merged updates allowed before the next run rebuilds the summary from scratch.
+SUMMARY_MAX_INCREMENTS = int(os.getenv("SUMMARY_MAX_INCREMENTS", "4"))
+
+
+def item_fingerprint(item):
+    """Content hash of a WorkItem; changes whenever any of its fields change"""
+    payload = json.dumps(item.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def item_key(item, fingerprint):
+    """Stable identity of an item across runs; Slack ts values are only unique within a channel"""
+    if item.source == 'slack' and item.id:
+        return f"{item.container}:{item.id}"
+    return item.id or fingerprint
+
+
+def item_label(item):
+    """Short one-line description used to tell the model which items went away"""
+    text = item.title or item.body or item.id or ""
+    return " ".join(str(text).split())[:80]
+
+
+class IncrementalSummarizer:
+    """
+    Keeps each source's last summary with the fingerprints of the items it
+    covered, and only sends new, changed and removed items on later runs.
+
+    A run rebuilds the summary in full when there is no previous summary,
+    the day has changed, or max_increments merges have been applied since
+    the last rebuild.
+    """
+
+    def __init__(self, llm_client, store=None, max_increments=SUMMARY_MAX_INCREMENTS):
+        self.llm_client = llm_client
+        self._store = store
+        self.max_increments = max_increments
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = SummaryStore()
+        return self._store
+
+    def summarize(self, source, items, full_summarize, **request_kwargs):
+        """
+        Summarize items for a source, merging into the previous summary when possible
+
+        Args:
+            source (str): 'emails', 'meetings', 'jira' or 'slack'
+            items (list): WorkItems for the whole current view of the source
+            full_summarize (callable): Builds a summary from scratch given items
+            **request_kwargs: Extra arguments passed to both full_summarize and the merge
+
+        Returns:
+            str: Up-to-date summary
+        """
+        plan = self._plan(source, items)
+        if plan['full']:
+            summary = full_summarize(items, **request_kwargs)
+        elif not plan['changed'] and not plan['removed']:
+            return plan['previous']['summary']
+        else:
+            summary = self.llm_client.merge_summary(
+                source, plan['previous']['summary'], plan['changed'], plan['removed'], **request_kwargs
+            )
+        self._save(source, plan, summary)
+        return summary
+
+    async def asummarize(self, source, items, afull_summarize, **request_kwargs):
+        """Async variant of summarize; afull_summarize is awaited"""
+        plan = self._plan(source, items)
+        if plan['full']:
+            summary = await afull_summarize(items, **request_kwargs)
+        elif not plan['changed'] and not plan['removed']:
+            return plan['previous']['summary']
+        else:
+            summary = await self.llm_client.amerge_summary(
+                source, plan['previous']['summary'], plan['changed'], plan['removed'], **request_kwargs
+            )
+        self._save(source, plan, summary)
+        return summary
+
+    def _plan(self, source, items):
+        today = date.today().isoformat()
+        current = {}
+        for item in items:
+            fingerprint = item_fingerprint(item)
+            current[item_key(item, fingerprint)] = (item, fingerprint)
+        previous = self.store.get_summary(source)
+        full = (
+            previous is None
+            or previous['day'] != today
+            or previous['increments'] >= self.max_increments
+        )
+        changed, removed = list(items), []
+        if not full:
+            known = previous['items']
+            changed = [
+                item for key, (item, fingerprint) in current.items()
+                if known.get(key, [None])[0] != fingerprint
+            ]
+            # An item whose key changed (e.g. one stored before it had an id) would
+            # otherwise be asked to be both added and dropped in the same merge.
+            changed_labels = {item_label(item) for item in changed}
+            removed = [
+                label for key, (_, label) in known.items()
+                if key not in current and label not in changed_labels
+            ]
+        return {
+            'day': today,
+            'full': full,
+            'previous': previous,
+            'changed': changed,
+            'removed': removed,
+            'items': {key: [fingerprint, item_label(item)] for key, (item, fingerprint) in current.items()},
+        }
+
+    def _save(self, source, plan, summary):
+        if not summary or summary.startswith(ERROR_PREFIX):
+            return
+        increments = 0 if plan['full'] else plan['previous']['increments'] + 1
+        self.store.save_summary(source, plan['day'], summary, plan['items'], increments)
@@ -0,0 +1,92 @@
+"""
+Content-addressed cache for LLM responses
+"""
+import os
+import hashlib
+import threading
+from src.storage.llm_cache_store import LLMCacheStore
+
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() != "false"
+
+# Evict on every Nth write rather than on each one.
+EVICT_EVERY = 50
+
+
+class LLMCache:
+    """
+    Persistent response cache keyed by a hash of model, prompt template and input
+
+    Identical requests within the TTL are answered from disk; the store is
+    trimmed to max_entries by least recent use.
+    """
+
+    def __init__(self, store=None, ttl=LLM_CACHE_TTL_SECONDS, max_entries=LLM_CACHE_MAX_ENTRIES):
+        self._store = store
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = LLMCacheStore()
+        return self._store
+
+    @staticmethod
+    def make_key(model_name, template, text):
+        """sha256 over the model name, prompt template and rendered input"""
+        digest = hashlib.sha256()
+        for part in (model_name, template or "", text or ""):
+            encoded = part.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def get(self, key):
+        response = self.store.get(key, max_age=self.ttl)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(self, key, model_name, response):
+        self.store.put(key, model_name, response)
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % EVICT_EVERY == 0
+        if evict:
+            self.store.evict(max_entries=self.max_entries, max_age=self.ttl)
+
+    def get_stats(self):
+        """Hit/miss counters for this process and the number of stored entries"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "entries": self.store.count(),
+        }
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """Return the process-wide LLMCache, or None when LLM_CACHE_ENABLED is false"""
+    global _default_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = LLMCache()
+        return _default_cache
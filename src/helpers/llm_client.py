@@ -1,31 +1,141 @@
 import os
+import asyncio
+import threading
+import weakref
 import google.generativeai as genai
 from dotenv import load_dotenv
 from langfuse import observe
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
 from src.helpers.todo_schema import TodoList
+from src.helpers.schedule_analysis import analyze_schedule, format_schedule_facts
+from src.helpers.llm_cache import LLMCache, get_llm_cache
+from src.helpers.chunking import CHUNK_TOKEN_BUDGET, chunk_blocks, estimate_tokens
+from src.helpers.prompt_compactor import compactor
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.runnables import RunnableLambda
 
 load_dotenv()
 
 
+MODEL_NAME = 'gemini-2.0-flash'
+# analyze_text reports failures in-band as a string starting with this prefix.
+ERROR_PREFIX = "Error analyzing text"
+# Bounds for the async API: concurrent requests per event loop and seconds per request.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
+# One semaphore per event loop shared by every GeminiClient, so LLM_MAX_CONCURRENCY
+# bounds the whole workflow rather than each agent's client.
+_semaphores = weakref.WeakKeyDictionary()
+_semaphores_lock = threading.Lock()
+# The same bound for blocking calls made from worker threads.
+_sync_semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+
+def _get_semaphore():
+    loop = asyncio.get_running_loop()
+    with _semaphores_lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _semaphores[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return semaphore
+
+# How each source is named in the summary merge prompt.
+MERGE_SOURCE_LABELS = {
+    'emails': 'email',
+    'meetings': 'meeting schedule',
+    'jira': 'JIRA tickets',
+    'slack': 'Slack messages',
+}
+
+# Map step of map-reduce summarization; {label} is filled in per source.
+CHUNK_SUMMARY_PROMPT = """
+        The following is one batch of {label} taken from a larger set.
+        List every important item as a terse bullet point, keeping:
+        - who it is from and any ticket keys or channel names, verbatim
+        - action items or requests directed at the user
+        - deadlines, due dates and priorities
+        Do not add commentary or headings.
+        
+        {title}:
+        {{text}}
+        """
+
+
 class GeminiClient:
-    def __init__(self):
+    def __init__(self, cache=None, timeout=LLM_TIMEOUT_SECONDS):
+        """
+        Args:
+            cache (LLMCache, optional): Response cache; defaults to the shared
+                on-disk cache unless LLM_CACHE_ENABLED is false
+            timeout (float): Seconds before an async request is abandoned
+        """
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
         
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model_name = MODEL_NAME
+        self.model = genai.GenerativeModel(self.model_name)
+        self.cache = cache or get_llm_cache()
+        self.timeout = timeout
+        
+    def _cache_lookup(self, prompt, template, use_cache):
+        """Return (key, cached response) or (None, None) when caching is off"""
+        if not use_cache or self.cache is None:
+            return None, None
+        key = LLMCache.make_key(self.model_name, template, prompt)
+        return key, self.cache.get(key)
+
+    def _cache_store(self, key, text, validate=None):
+        if key is None:
+            return
+        if validate is not None:
+            validate(text)
+        self.cache.put(key, self.model_name, text)
+
+    def _generate(self, prompt, template=None, use_cache=True, validate=None):
+        """
+        Call the model, answering byte-identical requests from the response cache
+
+        Exceptions propagate to the caller, so failed calls are never cached.
+        When validate is given, a response is only cached if it returns without raising.
+        """
+        prompt = compactor.compact_prompt(prompt)
+        key, cached = self._cache_lookup(prompt, template, use_cache)
+        if cached is not None:
+            return cached
+        with _sync_semaphore:
+            response = self.model.generate_content(prompt)
+        text = response.text if hasattr(response, "text") else str(response)
+        self._cache_store(key, text, validate)
+        return text
+
+    async def _agenerate(self, prompt, template=None, use_cache=True, validate=None):
+        """
+        Async _generate: at most LLM_MAX_CONCURRENCY requests in flight per process, each bounded by timeout
+        """
+        prompt = compactor.compact_prompt(prompt)
+        key, cached = self._cache_lookup(prompt, template, use_cache)
+        if cached is not None:
+            return cached
+        async with _get_semaphore():
+            response = await asyncio.wait_for(
+                self.model.generate_content_async(prompt), timeout=self.timeout
+            )
+        text = response.text if hasattr(response, "text") else str(response)
+        self._cache_store(key, text, validate)
+        return text
         
-    def analyze_text(self, text, prompt_template=None):
+    def analyze_text(self, text, prompt_template=None, use_cache=True):
         """
         Analyze text using Gemini model
         
         Args:
             text (str): Text to analyze
             prompt_template (str, optional): Custom prompt template to use
+            use_cache (bool): Serve and store this call in the response cache
         
         Returns:
             str: Generated response from the model
@@ -36,15 +146,33 @@ class GeminiClient:
             else:
                 prompt = text
                 
-            response = self.model.generate_content(prompt)
-            return response.text
+            return self._generate(prompt, prompt_template, use_cache=use_cache)
+        except Exception as e:
+            print(f"Error in analyzing text: {str(e)}")
+            return f"{ERROR_PREFIX}: {str(e)}"
+
+    async def aanalyze_text(self, text, prompt_template=None, use_cache=True):
+        """
+        Async variant of analyze_text
+
+        Returns:
+            str: Generated response, or an error message on failure or timeout
+        """
+        try:
+            prompt = prompt_template.format(text=text) if prompt_template else text
+            return await self._agenerate(prompt, prompt_template, use_cache=use_cache)
+        except asyncio.TimeoutError:
+            print(f"Timed out analyzing text after {self.timeout}s")
+            return f"{ERROR_PREFIX}: timed out after {self.timeout}s"
         except Exception as e:
             print(f"Error in analyzing text: {str(e)}")
-            return f"Error analyzing text: {str(e)}"
+            return f"{ERROR_PREFIX}: {str(e)}"
     
-    def create_todo_list(self, email_summary, meetings_summary, jira_summary, slack_summary):
+    def _todo_chain(self, use_cache=True):
         """
-        Create a todo list from all sources.
+        Prompt | Gemini | JSON parser chain used by create_todo_list and acreate_todo_list.
+
+        The raw model output is cached before parsing, keyed on the rendered prompt.
         """
         parser = JsonOutputParser(pydantic_object=TodoList)
         prompt = PromptTemplate(
@@ -60,35 +188,102 @@ class GeminiClient:
             partial_variables={"format_instructions": parser.get_format_instructions()},
         )
 
-        def gemini_invoke(prompt_dict):
+        def to_prompt_str(prompt_dict):
             if isinstance(prompt_dict, dict):
                 prompt_str = prompt_dict.get("input", "")
                 if not prompt_str:
                     prompt_str = next(iter(prompt_dict.values()), "")
             else:
                 prompt_str = str(prompt_dict)
-            response = self.model.generate_content(prompt_str)
-            return response.text if hasattr(response, "text") else str(response)
+            return prompt_str
+
+        def gemini_invoke(prompt_dict):
+            return self._generate(
+                to_prompt_str(prompt_dict), prompt.template, use_cache=use_cache, validate=parser.parse
+            )
+
+        async def gemini_ainvoke(prompt_dict):
+            return await self._agenerate(
+                to_prompt_str(prompt_dict), prompt.template, use_cache=use_cache, validate=parser.parse
+            )
     
-        chain = prompt | RunnableLambda(gemini_invoke) | parser
-        return chain.invoke({
+        return prompt | RunnableLambda(gemini_invoke, afunc=gemini_ainvoke) | parser
+
+    def create_todo_list(self, email_summary, meetings_summary, jira_summary, slack_summary, use_cache=True):
+        """
+        Create a todo list from all sources.
+        """
+        return self._todo_chain(use_cache).invoke({
+            "email_summary": email_summary,
+            "meetings_summary": meetings_summary,
+            "jira_summary": jira_summary,
+            "slack_summary": slack_summary,
+        })
+
+    async def acreate_todo_list(self, email_summary, meetings_summary, jira_summary, slack_summary, use_cache=True):
+        """
+        Async variant of create_todo_list; raises asyncio.TimeoutError past the client timeout.
+        """
+        return await self._todo_chain(use_cache).ainvoke({
             "email_summary": email_summary,
             "meetings_summary": meetings_summary,
             "jira_summary": jira_summary,
             "slack_summary": slack_summary,
         })
     
-    @observe(name="email_summary")
-    def summarize_emails(self, emails):
+    def _chunk_requests(self, blocks, label):
         """
-        Summarize emails
-        
-        Args:
-            emails (list): List of email details
-        
+        Split blocks into token-budgeted chunks for map-reduce summarization
+
         Returns:
-            str: Summary of emails
+            list: (text, prompt) pairs for the map step, or None when the
+                blocks fit in a single request
         """
+        if sum(estimate_tokens(block) for block in blocks) <= CHUNK_TOKEN_BUDGET:
+            return None
+        map_prompt = CHUNK_SUMMARY_PROMPT.format(label=label, title=label[:1].upper() + label[1:])
+        return [("\n\n".join(chunk), map_prompt) for chunk in chunk_blocks(blocks)]
+
+    def _reduce_text(self, partials, label):
+        return "\n\n".join(
+            f"Notes on {label}, batch {index} of {len(partials)}:\n{partial}"
+            for index, partial in enumerate(partials, 1)
+        )
+
+    def _first_error(self, partials):
+        return next((partial for partial in partials if partial.startswith(ERROR_PREFIX)), None)
+
+    def _summarize_blocks(self, blocks, prompt, label):
+        """
+        Summarize item blocks with prompt, using map-reduce when they exceed the chunk budget
+
+        Each chunk is summarized in parallel (and cached on its own text), then
+        the chunk notes are reduced into prompt's section format. If any chunk
+        fails, its error is returned instead of a summary missing that chunk.
+        """
+        requests = self._chunk_requests(blocks, label)
+        if requests is None:
+            return self.analyze_text("\n\n".join(blocks), prompt)
+        with ThreadPoolExecutor(max_workers=min(LLM_MAX_CONCURRENCY, len(requests))) as executor:
+            partials = list(executor.map(lambda request: self.analyze_text(*request), requests))
+        error = self._first_error(partials)
+        if error:
+            return error
+        return self.analyze_text(self._reduce_text(partials, label), prompt)
+
+    async def _asummarize_blocks(self, blocks, prompt, label):
+        """Async variant of _summarize_blocks; the map step is bounded by the shared semaphore"""
+        requests = self._chunk_requests(blocks, label)
+        if requests is None:
+            return await self.aanalyze_text("\n\n".join(blocks), prompt)
+        partials = await asyncio.gather(*(self.aanalyze_text(*request) for request in requests))
+        error = self._first_error(partials)
+        if error:
+            return error
+        return await self.aanalyze_text(self._reduce_text(partials, label), prompt)
+
+    def _emails_request(self, emails):
+        """Build one text block per email and the prompt template for summarize_emails"""
         prompt = """
         Analyze the following emails and provide:
         1. A concise summary of key points from each important email
@@ -118,33 +313,43 @@ class GeminiClient:
         2. [Action 2]
         """
         
-        emails_text = "\n\n".join([
-            f"From: {email.get('from', 'Unknown')}\n"
-            f"Subject: {email.get('subject', 'No Subject')}\n"
-            f"Date: {email.get('date', 'Unknown')}\n"
-            f"Snippet: {email.get('snippet', '')}\n"
-            f"Body: {email.get('body', 'No body available')}\n"
+        blocks = [
+            f"From: {email.person or 'Unknown'}\n"
+            f"Subject: {email.title or 'No Subject'}\n"
+            f"Date: {email.timestamp or 'Unknown'}\n"
+            + (f"Body: {compactor.compact_item(email.body, 'email')}\n" if email.body
+               else f"Snippet: {email.snippet or 'No body available'}\n")
             for email in emails if email
-        ])
+        ]
         
-        return self.analyze_text(emails_text, prompt)
+        return blocks, prompt
 
-    @observe(name="meeting_summary")
-    def summarize_meetings(self, events):
+    @observe(name="email_summary")
+    def summarize_emails(self, emails):
         """
-        Summarize calendar events
+        Summarize emails
         
         Args:
-            events (list): List of calendar events
+            emails (iterable): Email WorkItems; a generator is consumed lazily
         
         Returns:
-            str: Summary of events
+            str: Summary of emails
         """
+        return self._summarize_blocks(*self._emails_request(emails), label="emails")
+
+    @observe(name="email_summary")
+    async def asummarize_emails(self, emails):
+        """Async variant of summarize_emails"""
+        return await self._asummarize_blocks(*self._emails_request(emails), label="emails")
+
+    def _meetings_request(self, events, schedule_facts=None):
+        """Build the text and prompt template sent to the model for summarize_meetings"""
         prompt = """
         Analyze the following calendar events and provide:
         1. A timeline of upcoming meetings for today and tomorrow
         2. Note any preparation needed for meetings
-        3. Highlight conflicts or back-to-back meetings
+        3. Highlight conflicts or back-to-back meetings, using only the precomputed
+           Schedule Analysis below (do not infer overlaps yourself)
         
         Calendar Events:
         {text}
@@ -167,36 +372,54 @@ class GeminiClient:
         """
         
         events_text = "\n\n".join([
-            f"Title: {event.get('summary', 'No Title')}\n"
-            f"Start: {event.get('start', 'Unknown')}\n"
-            f"End: {event.get('end', 'Unknown')}\n"
-            f"Location: {event.get('location', 'No location')}\n"
-            f"Hangout Link: {event.get('hangoutLink', '')}\n"
-            f"Organizer: {event.get('organizer', 'Unknown')}\n"
-            f"Attendees: {', '.join(event.get('attendees', []))}\n"
-            f"Description: {event.get('description', '')}\n"
-            f"Status: {event.get('status', 'Unknown')}\n"
+            f"Title: {event.title or 'No Title'}\n"
+            f"Calendar: {event.container or 'primary'}\n"
+            f"Start: {event.timestamp or 'Unknown'}\n"
+            f"End: {event.end or 'Unknown'}\n"
+            f"Location: {event.location or 'No location'}\n"
+            f"Hangout Link: {event.link or ''}\n"
+            f"Organizer: {event.person or 'Unknown'}\n"
+            f"Attendees: {', '.join(event.participants)}\n"
+            f"Description: {compactor.compact_item(event.body, 'event') or ''}\n"
+            f"Status: {event.status or 'Unknown'}\n"
             for event in events if event
         ])
         
-        return self.analyze_text(events_text, prompt)
+        if schedule_facts is None:
+            schedule_facts = analyze_schedule(events)
+        events_text += "\n\nSchedule Analysis:\n" + format_schedule_facts(schedule_facts)
+        
+        return events_text, prompt
 
-    @observe(name="jira_summary")
-    def summarize_jira_tickets(self, jira_issues):
+    @observe(name="meeting_summary")
+    def summarize_meetings(self, events, schedule_facts=None):
         """
-        Summarize JIRA tickets
+        Summarize calendar events
         
         Args:
-            jira_issues: List of JIRA issue objects
+            events (list): Calendar event WorkItems
+            schedule_facts (dict, optional): Precomputed conflicts and back-to-back
+                meetings from analyze_schedule; computed here when omitted
         
         Returns:
-            str: Summary of JIRA tickets
+            str: Summary of events
         """
+        return self.analyze_text(*self._meetings_request(events, schedule_facts=schedule_facts))
+
+    @observe(name="meeting_summary")
+    async def asummarize_meetings(self, events, schedule_facts=None):
+        """Async variant of summarize_meetings"""
+        return await self.aanalyze_text(*self._meetings_request(events, schedule_facts=schedule_facts))
+
+    def _jira_request(self, jira_issues):
+        """Build one text block per changed issue, one for the unchanged ones, and the prompt template"""
         prompt = """
         Analyze the following JIRA tickets and provide:
         1. A summary of tickets assigned to the user by priority
         2. Upcoming deadlines or due dates
-        3. Status updates on tickets
+        3. Status updates on tickets, based on the listed changes (status transitions,
+           new comments, due-date moves, reassignments)
+        4. Unchanged tickets only where a deadline or priority makes them relevant
         
         JIRA Tickets:
         {text}
@@ -222,30 +445,55 @@ class GeminiClient:
         2. [Ticket-456] - Due in [Y] days
         """
         
-        issues_text = ""
+        blocks = []
+        unchanged = []
         for issue in jira_issues:
-            issues_text += f"Key: {issue.key}\n"
-            issues_text += f"Summary: {issue.fields.summary}\n"
-            issues_text += f"Status: {issue.fields.status.name}\n"
-            issues_text += f"Priority: {issue.fields.priority.name if hasattr(issue.fields, 'priority') and issue.fields.priority else 'Not set'}\n"
-            issues_text += f"Assignee: {issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'}\n"
-            issues_text += f"Due Date: {issue.fields.duedate if hasattr(issue.fields, 'duedate') and issue.fields.duedate else 'Not set'}\n"
-            issues_text += f"Description: {issue.fields.description if issue.fields.description else 'No description'}\n\n"
-        
-        return self.analyze_text(issues_text, prompt)
-
+            if not issue.changes:
+                unchanged.append(
+                    f"- {issue.id} {issue.title} (Status: {issue.status}, "
+                    f"Priority: {issue.priority or 'Not set'}, Due: {issue.due or 'Not set'})"
+                )
+                continue
+            issue_text = f"Key: {issue.id}\n"
+            issue_text += f"Summary: {issue.title}\n"
+            issue_text += f"Status: {issue.status}\n"
+            issue_text += f"Priority: {issue.priority or 'Not set'}\n"
+            issue_text += f"Assignee: {issue.person or 'Unassigned'}\n"
+            issue_text += f"Due Date: {issue.due or 'Not set'}\n"
+            if issue.created_in_window:
+                issue_text += f"Description: {compactor.compact_item(issue.body, 'jira') or 'No description'}\n"
+            issue_text += "Changes:\n" + "".join(f"  - {change}\n" for change in issue.changes)
+            blocks.append(issue_text)
+        if unchanged:
+            blocks.append("Unchanged tickets:\n" + "\n".join(unchanged) + "\n")
+        
+        return blocks, prompt
 
-    @observe(name="slack_summary")
-    def summarize_slack_messages(self, messages):
+    @observe(name="jira_summary")
+    def summarize_jira_tickets(self, jira_issues):
         """
-        Summarize Slack messages
+        Summarize JIRA tickets
+        
+        Issues with recorded changes are sent with their deltas; the rest
+        are sent as one-line references so the prompt grows with activity
+        rather than with the size of the backlog.
         
         Args:
-            messages (list): List of Slack message details
+            jira_issues (list): JIRA issue WorkItems
         
         Returns:
-            str: Summary of Slack messages
+            str: Summary of JIRA tickets
         """
+        return self._summarize_blocks(*self._jira_request(jira_issues), label="JIRA tickets")
+
+    @observe(name="jira_summary")
+    async def asummarize_jira_tickets(self, jira_issues):
+        """Async variant of summarize_jira_tickets"""
+        return await self._asummarize_blocks(*self._jira_request(jira_issues), label="JIRA tickets")
+
+
+    def _slack_request(self, messages):
+        """Build one text block per Slack thread and the prompt template for summarize_slack_messages"""
         prompt = """
         Analyze the following Microsoft Slack messages and provide:
         1. A summary of important conversations
@@ -270,20 +518,53 @@ class GeminiClient:
         1. Respond to [Person] about [Topic]
         """
         
-        messages_text = "\n\n".join([
-            f"Channel: {msg.get('channel', 'Unknown')}\n"
-            f"User: {msg.get('user', 'Unknown')}\n"
-            f"Time: {msg.get('time', 'Unknown')}\n"
-            f"Message: {msg.get('text', '')}"
-            for msg in messages if msg
-        ])
+        blocks = [
+            f"Channel: {msg.container or 'Unknown'}\n"
+            f"User: {msg.person or 'Unknown'}\n"
+            f"Time: {msg.timestamp or 'Unknown'}\n"
+            f"Message: {compactor.compact_item(msg.body, 'slack') or ''}"
+            + "".join(
+                f"\n  Reply from {reply.person or 'Unknown'}: {compactor.compact_item(reply.body, 'slack') or ''}"
+                for reply in msg.replies
+            )
+            for msg in self._dedupe_messages(messages)
+        ]
         
-        return self.analyze_text(messages_text, prompt)
+        return blocks, prompt
 
-    @observe(name="daily_summary")
-    def create_daily_summary(self, email_summary, meetings_summary, jira_summary, slack_summary):
+    def _dedupe_messages(self, messages):
+        """Skip repeats of the same text in the same channel, e.g. bot alerts firing over and over"""
+        seen = set()
+        for msg in messages:
+            if not msg:
+                continue
+            key = (msg.container, msg.body)
+            if msg.body and key in seen and not msg.replies:
+                continue
+            seen.add(key)
+            yield msg
+
+    @observe(name="slack_summary")
+    def summarize_slack_messages(self, messages):
         """
-        Create a comprehensive daily summary from all sources
+        Summarize Slack messages
+        
+        Args:
+            messages (list): Slack message WorkItems
+        
+        Returns:
+            str: Summary of Slack messages
+        """
+        return self._summarize_blocks(*self._slack_request(messages), label="Slack messages")
+
+    @observe(name="slack_summary")
+    async def asummarize_slack_messages(self, messages):
+        """Async variant of summarize_slack_messages"""
+        return await self._asummarize_blocks(*self._slack_request(messages), label="Slack messages")
+
+    def _daily_summary_prompt(self, email_summary, meetings_summary, jira_summary, slack_summary):
+        """
+        Build the prompt for create_daily_summary
         
         Args:
             email_summary (str): Summary of emails
@@ -292,7 +573,7 @@ class GeminiClient:
             slack_summary (str): Summary of Slack messages
         
         Returns:
-            str: Comprehensive daily summary with action items
+            str: Rendered prompt
         """
         prompt = """
         Create a comprehensive daily summary based on the following information from different sources:
@@ -318,12 +599,94 @@ class GeminiClient:
         Format your response as a professional daily briefing.
         """
         
+        return prompt.format(
+            email_summary=email_summary,
+            meetings_summary=meetings_summary,
+            jira_summary=jira_summary,
+            slack_summary=slack_summary
+        )
+
+    def _merge_request(self, source, previous_summary, items, removed, **request_kwargs):
+        """
+        Build the text and prompt that fold new, changed and removed items into a previous summary
+
+        Args:
+            source (str): 'emails', 'meetings', 'jira' or 'slack'
+            previous_summary (str): Summary produced by an earlier run
+            items (list): WorkItems that are new or changed since that run
+            removed (list): One-line labels of items that are no longer present
+            **request_kwargs: Passed to the source's request builder
+
+        Returns:
+            tuple: Text and prompt template for analyze_text
+        """
+        if source == 'emails':
+            blocks, _ = self._emails_request(items)
+        elif source == 'jira':
+            blocks, _ = self._jira_request(items)
+        elif source == 'slack':
+            blocks, _ = self._slack_request(items)
+        elif source == 'meetings':
+            blocks = [self._meetings_request(items, **request_kwargs)[0]]
+        else:
+            raise ValueError(f"Unknown summary source: {source}")
+
+        # The previous summary is part of the template, so escape it for str.format.
+        previous = previous_summary.replace("{", "{{").replace("}", "}}")
+        prompt = f"""
+        Below is the current {MERGE_SOURCE_LABELS[source]} summary, followed by items that
+        are new or have changed since it was written and items that no longer exist.
+        
+        Update the summary:
+        - add the new items and revise entries for changed items
+        - drop entries for items that no longer exist
+        - keep everything else as it is
+        - keep exactly the same headings and section format
+        Return only the updated summary.
+        
+        Current summary:
+        {previous}
+        
+        {{text}}
+        """
+        text = "New or changed items:\n" + ("\n\n".join(blocks) if items else "None")
+        text += "\n\nNo longer present:\n" + ("\n".join(f"- {label}" for label in removed) or "None")
+        return text, prompt
+
+    @observe(name="summary_merge")
+    def merge_summary(self, source, previous_summary, items, removed, **request_kwargs):
+        """
+        Merge new, changed and removed items into a previous summary for a source
+
+        Returns:
+            str: Updated summary in the same format as the previous one
+        """
+        return self.analyze_text(*self._merge_request(source, previous_summary, items, removed, **request_kwargs))
+
+    @observe(name="summary_merge")
+    async def amerge_summary(self, source, previous_summary, items, removed, **request_kwargs):
+        """Async variant of merge_summary"""
+        return await self.aanalyze_text(
+            *self._merge_request(source, previous_summary, items, removed, **request_kwargs)
+        )
+
+    @observe(name="daily_summary")
+    def create_daily_summary(self, email_summary, meetings_summary, jira_summary, slack_summary):
+        """
+        Create a comprehensive daily summary from all sources
+        
+        Returns:
+            str: Comprehensive daily summary with action items
+        """
         return self.analyze_text(
             "",
-            prompt.format(
-                email_summary=email_summary,
-                meetings_summary=meetings_summary,
-                jira_summary=jira_summary,
-                slack_summary=slack_summary
-            )
+            self._daily_summary_prompt(email_summary, meetings_summary, jira_summary, slack_summary)
+        )
+
+    @observe(name="daily_summary")
+    async def acreate_daily_summary(self, email_summary, meetings_summary, jira_summary, slack_summary):
+        """Async variant of create_daily_summary"""
+        return await self.aanalyze_text(
+            "",
+            self._daily_summary_prompt(email_summary, meetings_summary, jira_summary, slack_summary)
         )
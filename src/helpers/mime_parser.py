@@ -0,0 +1,117 @@
+"""
+Helpers for extracting readable text from Gmail message payloads
+"""
+import base64
+import html2text
+
+# Decoded body bytes kept per email; newsletters beyond this are cut off.
+DEFAULT_MAX_BODY_BYTES = 16 * 1024
+# HTML is decoded up to this multiple of the byte budget before conversion,
+# since markup usually outweighs the text it renders to.
+HTML_RAW_BUDGET_FACTOR = 4
+
+
+def iter_leaf_parts(payload):
+    """
+    Walk a Gmail payload's MIME tree depth-first and yield its leaf parts
+
+    Args:
+        payload (dict): The 'payload' field of a Gmail message resource
+
+    Yields:
+        dict: Non-multipart parts in document order
+    """
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        children = part.get('parts')
+        if children:
+            stack.extend(reversed(children))
+        else:
+            yield part
+
+
+def is_attachment(part):
+    """Return True for parts that are attachments rather than message text"""
+    if part.get('filename'):
+        return True
+    if part.get('body', {}).get('attachmentId'):
+        return True
+    headers = {h['name'].lower(): h['value'] for h in part.get('headers', [])}
+    return headers.get('content-disposition', '').lower().startswith('attachment')
+
+
+def decode_body_data(data, max_bytes):
+    """
+    Decode base64url body data, stopping once max_bytes have been produced
+
+    Only the prefix of the encoded string needed for max_bytes is decoded,
+    so oversized bodies are never materialised in full.
+    """
+    if not data or max_bytes <= 0:
+        return ""
+    encoded = data[:((max_bytes + 2) // 3) * 4]
+    encoded += "=" * (-len(encoded) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(encoded)[:max_bytes]
+    except Exception:
+        return ""
+    return raw.decode('utf-8', errors='ignore')
+
+
+def drop_partial_tag(html):
+    """Remove a tag left unclosed at the end of a truncated HTML prefix"""
+    start = html.rfind('<')
+    if start > html.rfind('>'):
+        return html[:start]
+    return html
+
+
+def html_to_text(html):
+    converter = html2text.HTML2Text()
+    converter.ignore_images = True
+    converter.ignore_links = True
+    converter.body_width = 0
+    return converter.handle(html).strip()
+
+
+def extract_body(payload, max_bytes=DEFAULT_MAX_BODY_BYTES):
+    """
+    Extract the readable body of a Gmail message
+
+    text/plain parts anywhere in the tree are preferred; if there are none,
+    text/html parts are converted to text with html2text. HTML is decoded
+    up to HTML_RAW_BUDGET_FACTOR times the budget and converted before the
+    text is cut to max_bytes, so truncated markup never reaches the text.
+    Attachment parts are skipped and never downloaded.
+
+    Args:
+        payload (dict): The 'payload' field of a Gmail message resource
+        max_bytes (int): Maximum number of decoded body bytes to keep
+
+    Returns:
+        str: Message body text, truncated to the byte budget
+    """
+    plain_parts, html_parts = [], []
+    for part in iter_leaf_parts(payload):
+        if is_attachment(part):
+            continue
+        mime_type = part.get('mimeType', '')
+        if mime_type == 'text/plain':
+            plain_parts.append(part)
+        elif mime_type == 'text/html':
+            html_parts.append(part)
+
+    chunks = []
+    remaining = max_bytes if plain_parts else max_bytes * HTML_RAW_BUDGET_FACTOR
+    for part in plain_parts or html_parts:
+        if remaining <= 0:
+            break
+        text = decode_body_data(part.get('body', {}).get('data', ''), remaining)
+        remaining -= len(text.encode('utf-8'))
+        chunks.append(text)
+
+    body = "\n".join(chunk for chunk in chunks if chunk)
+    if not plain_parts and body:
+        body = html_to_text(drop_partial_tag(body)).encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
+    return body
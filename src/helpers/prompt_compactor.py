@@ -0,0 +1,180 @@
+"""
+Prompt compaction: strip noise from item text and keep each item within a token budget
+"""
+import re
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from src.helpers.chunking import CHARS_PER_TOKEN, estimate_tokens
+
+# Per-item token budgets by item kind.
+ITEM_TOKEN_BUDGETS = {
+    'email': 400,
+    'event': 200,
+    'jira': 300,
+    'slack': 200,
+}
+
+TRACKING_PARAM_PREFIXES = ('utm_', 'mc_', '_hs', 'mkt_', 'trk', 'fbclid', 'gclid', 'ref_src')
+# URLs longer than this after removing tracking parameters are reduced to their host.
+MAX_URL_CHARS = 80
+# A signature is at most this many name-like lines after the delimiter or sign-off.
+SIGNATURE_MAX_LINES = 2
+SIGNATURE_MAX_WORDS = 4
+
+URL_RE = re.compile(r'https?://[^\s<>()\[\]"\']+')
+QUOTE_HEADER_RE = re.compile(
+    r'^\s*(On .{0,200} wrote:|-+\s*Original Message\s*-+)\s*$',
+    re.IGNORECASE
+)
+SIGNATURE_RE = re.compile(r'^\s*(--|Sent from my .*|Get Outlook for .*)\s*$', re.IGNORECASE)
+SIGNOFF_RE = re.compile(
+    r'^\s*(best|best regards|kind regards|regards|thanks|thank you|cheers|sincerely|warm regards),?\s*$',
+    re.IGNORECASE
+)
+
+
+def strip_quoted_replies(text):
+    """
+    Drop '>'-quoted lines and everything after a reply header
+
+    Forwarded messages are kept: they usually carry the request being
+    passed on, and the per-item budget truncates them.
+    """
+    lines = []
+    for line in text.splitlines():
+        if QUOTE_HEADER_RE.match(line):
+            break
+        if line.lstrip().startswith('>'):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _is_name_line(line):
+    """True for a short line of capitalized words with no sentence punctuation, e.g. 'John Smith'"""
+    words = line.rstrip(',').split()
+    return (
+        0 < len(words) <= SIGNATURE_MAX_WORDS
+        and all(word[0].isupper() for word in words)
+        and not line.endswith(('.', '?', '!', ':'))
+    )
+
+
+def strip_signature(text):
+    """
+    Cut a trailing signature block that starts at a '--' delimiter or a closing sign-off
+
+    The cut only happens when the marker follows some content, at most
+    SIGNATURE_MAX_LINES name-like lines come after it, and the block is
+    shorter than what it leaves behind, so a 'Thanks' that opens or sits
+    inside a message never drops the content that follows it.
+    """
+    lines = text.splitlines()
+    for index, line in enumerate(lines):
+        if not (SIGNATURE_RE.match(line) or SIGNOFF_RE.match(line)):
+            continue
+        head = "\n".join(lines[:index])
+        tail = [rest.strip() for rest in lines[index + 1:] if rest.strip()]
+        if (
+            head.strip()
+            and len(tail) <= SIGNATURE_MAX_LINES
+            and all(_is_name_line(rest) for rest in tail)
+            and len(text) - len(head) < len(head)
+        ):
+            return head
+    return text
+
+
+def _shorten_url(match):
+    url = match.group(0)
+    try:
+        parts = urlsplit(url)
+        query = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        ]
+        url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+    except ValueError:
+        return url
+    if len(url) > MAX_URL_CHARS:
+        return f"<link: {parts.netloc}>"
+    return url
+
+
+def strip_tracking_urls(text):
+    """Remove tracking parameters from URLs and reduce long redirect links to their host"""
+    return URL_RE.sub(_shorten_url, text)
+
+
+def compact_whitespace(text):
+    """Collapse runs of spaces and blank lines and trim every line"""
+    lines = [re.sub(r'[ \t ]+', ' ', line).strip() for line in text.splitlines()]
+    return re.sub(r'\n{3,}', '\n\n', "\n".join(lines)).strip()
+
+
+def truncate_tokens(text, max_tokens):
+    """Cut text to roughly max_tokens, on a word boundary"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    cut = text[:max_tokens * CHARS_PER_TOKEN]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut + " ...[truncated]"
+
+
+class PromptCompactor:
+    """
+    Compacts item text and whole prompts before they reach the model,
+    recording estimated token counts before and after per kind
+    """
+
+    def __init__(self, budgets=None):
+        self.budgets = dict(ITEM_TOKEN_BUDGETS, **(budgets or {}))
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def compact_item(self, text, kind):
+        """
+        Strip noise from one item's text and truncate it to the kind's budget
+
+        Args:
+            text (str): Email body, event description, JIRA description or Slack message
+            kind (str): 'email', 'event', 'jira' or 'slack'
+
+        Returns:
+            str: Compacted text
+        """
+        if not text:
+            return text
+        compacted = text
+        if kind == 'email':
+            compacted = strip_signature(strip_quoted_replies(compacted))
+        compacted = compact_whitespace(strip_tracking_urls(compacted))
+        if kind in self.budgets:
+            compacted = truncate_tokens(compacted, self.budgets[kind])
+        self._record(kind, text, compacted)
+        return compacted
+
+    def compact_prompt(self, prompt):
+        """Whitespace-only pass over a fully rendered prompt"""
+        compacted = compact_whitespace(prompt)
+        self._record('prompt', prompt, compacted)
+        return compacted
+
+    def _record(self, kind, before, after):
+        with self._lock:
+            stats = self._stats.setdefault(kind, {'items': 0, 'tokens_before': 0, 'tokens_after': 0})
+            stats['items'] += 1
+            stats['tokens_before'] += estimate_tokens(before)
+            stats['tokens_after'] += estimate_tokens(after)
+
+    def get_stats(self):
+        """Estimated token counts before and after compaction, per kind"""
+        with self._lock:
+            return {
+                kind: dict(stats, saved=stats['tokens_before'] - stats['tokens_after'])
+                for kind, stats in self._stats.items()
+            }
+
+
+compactor = PromptCompactor()
@@ -0,0 +1,75 @@
+"""
+Deterministic conflict and back-to-back detection for calendar events
+"""
+from dateutil import parser
+
+# Meetings separated by at most this many minutes count as back-to-back.
+BACK_TO_BACK_GAP_MINUTES = 5
+
+
+def _timed_intervals(events):
+    """Yield (start, end, event) for events with a time of day, sorted by start."""
+    intervals = []
+    for event in events:
+        start, end = event.timestamp, event.end
+        if not start or not end or 'T' not in start or 'T' not in end:
+            continue
+        intervals.append((parser.isoparse(start), parser.isoparse(end), event))
+    intervals.sort(key=lambda interval: (interval[0], interval[1]))
+    return intervals
+
+
+def analyze_schedule(events, gap_minutes=BACK_TO_BACK_GAP_MINUTES):
+    """
+    Find overlapping and back-to-back meetings with a single sweep over start times
+
+    All-day events are ignored since they do not block time.
+
+    Args:
+        events (list): Event WorkItems with ISO 'timestamp' and 'end' values
+        gap_minutes (int): Largest gap between two meetings that counts as back-to-back
+
+    Returns:
+        dict: 'conflicts' and 'back_to_back' lists of event pairs with their times
+    """
+    intervals = _timed_intervals(events)
+    conflicts, back_to_back = [], []
+    active = []
+    latest = None
+    for start, end, event in intervals:
+        active = [item for item in active if item[1] > start]
+        for other_start, other_end, other in active:
+            conflicts.append({
+                'first': other.title or 'No Title',
+                'second': event.title or 'No Title',
+                'overlap_start': start.isoformat(),
+                'overlap_end': min(end, other_end).isoformat(),
+            })
+        if not active and latest is not None:
+            gap = (start - latest[1]).total_seconds() / 60
+            if 0 <= gap <= gap_minutes:
+                back_to_back.append({
+                    'first': latest[2].title or 'No Title',
+                    'second': event.title or 'No Title',
+                    'gap_minutes': int(gap),
+                    'at': start.isoformat(),
+                })
+        active.append((start, end, event))
+        if latest is None or end >= latest[1]:
+            latest = (start, end, event)
+    return {'conflicts': conflicts, 'back_to_back': back_to_back}
+
+
+def format_schedule_facts(facts):
+    """Render analyze_schedule output as plain text for an LLM prompt."""
+    lines = ["Conflicts:"]
+    lines += [
+        f"- {c['first']} overlaps {c['second']} ({c['overlap_start']} to {c['overlap_end']})"
+        for c in facts.get('conflicts', [])
+    ] or ["- None"]
+    lines.append("Back-to-back meetings:")
+    lines += [
+        f"- {b['first']} -> {b['second']} ({b['gap_minutes']} min gap at {b['at']})"
+        for b in facts.get('back_to_back', [])
+    ] or ["- None"]
+    return "\n".join(lines)
@@ -0,0 +1,140 @@
+"""
+In-memory Google credential manager with proactive background refresh
+"""
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+TOKEN_FILE = 'token.json'
+CLIENT_SECRETS_FILE = 'src/config/credentials.json'
+
+# Refresh this many seconds before the access token expires.
+REFRESH_MARGIN_SECONDS = 300
+RETRY_DELAY_SECONDS = 60
+
+# Requested together on first authorization so Gmail, Calendar and the
+# langchain toolkits all share one token instead of prompting separately.
+DEFAULT_SCOPES = [
+    'https://mail.google.com/',
+    'https://www.googleapis.com/auth/calendar',
+]
+
+# A granted scope on the right also satisfies a request for the scope on the left.
+IMPLIED_BY = {
+    'https://www.googleapis.com/auth/gmail.readonly': 'https://mail.google.com/',
+    'https://www.googleapis.com/auth/calendar.readonly': 'https://www.googleapis.com/auth/calendar',
+}
+
+
+class CredentialManager:
+    """
+    Holds a single set of user credentials covering every scope the
+    process needs (Gmail, Calendar and the langchain toolkits).
+
+    Credentials are read from the token file once, kept in memory and
+    refreshed on a background timer ahead of expiry, so callers never
+    block on a refresh or on file I/O in the common case. The token file
+    is only ever replaced atomically.
+    """
+
+    def __init__(self, token_file=TOKEN_FILE, client_secrets_file=CLIENT_SECRETS_FILE,
+                 scopes=DEFAULT_SCOPES):
+        self.token_file = token_file
+        self.scopes = set(scopes)
+        self.client_secrets_file = client_secrets_file
+        self._creds = None
+        self._lock = threading.RLock()
+        self._timer = None
+
+    def get_credentials(self, scopes):
+        """
+        Return credentials that carry the requested scopes
+
+        Args:
+            scopes (list): OAuth scopes the caller needs
+
+        Returns:
+            Credentials: Shared, valid user credentials
+        """
+        creds = self._creds
+        if creds is not None and creds.valid and self._covers(creds, scopes):
+            return creds
+        with self._lock:
+            creds = self._creds
+            if creds is None:
+                creds = self._load()
+            if not self._covers(creds, scopes):
+                creds = self._authorize(set(creds.scopes or []) | set(scopes) if creds else scopes)
+            elif not creds.valid:
+                self._refresh(creds)
+            self._creds = creds
+            self._schedule_refresh()
+            return creds
+
+    def _covers(self, creds, scopes):
+        if creds is None:
+            return False
+        granted = set(creds.scopes or [])
+        return all(scope in granted or IMPLIED_BY.get(scope) in granted for scope in scopes)
+
+    def _load(self):
+        if not os.path.exists(self.token_file):
+            return None
+        return Credentials.from_authorized_user_file(self.token_file)
+
+    def _authorize(self, scopes):
+        """Run the installed-app flow for the union of all requested scopes."""
+        flow = InstalledAppFlow.from_client_secrets_file(
+            self.client_secrets_file, sorted(self.scopes | set(scopes))
+        )
+        creds = flow.run_local_server(port=0)
+        self._save(creds)
+        return creds
+
+    def _refresh(self, creds):
+        creds.refresh(Request())
+        self._save(creds)
+
+    def _save(self, creds):
+        """Write the token file atomically so readers never see a partial file."""
+        directory = os.path.dirname(os.path.abspath(self.token_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.token-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as tmp:
+                tmp.write(creds.to_json())
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, self.token_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _schedule_refresh(self, delay=None):
+        if self._timer is not None:
+            self._timer.cancel()
+        if delay is None:
+            expiry = self._creds.expiry if self._creds else None
+            if expiry is None:
+                return
+            delay = (expiry - datetime.utcnow()).total_seconds() - REFRESH_MARGIN_SECONDS
+        self._timer = threading.Timer(max(delay, 0), self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self):
+        with self._lock:
+            try:
+                self._refresh(self._creds)
+                self._schedule_refresh()
+            except Exception as e:
+                print(f"Error refreshing Google credentials: {str(e)}")
+                self._schedule_refresh(delay=RETRY_DELAY_SECONDS)
+
+
+credential_manager = CredentialManager()
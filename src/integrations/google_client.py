@@ -1,100 +1,391 @@
-import os.path
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-import base64
+from dateutil import parser, tz
+from googleapiclient.errors import HttpError
+from src.integrations.google_services import (
+    get_service,
+    GMAIL_READONLY_SCOPE,
+    CALENDAR_READONLY_SCOPE,
+)
+from src.storage.gmail_store import GmailStore
+from src.storage.calendar_store import CalendarStore
+from src.helpers.mime_parser import extract_body, DEFAULT_MAX_BODY_BYTES
+from src.helpers.email_ranker import EmailRanker, METADATA_HEADERS
 
-SCOPES = [
-    'https://www.googleapis.com/auth/gmail.readonly',
-    'https://www.googleapis.com/auth/calendar.readonly'
-]
+SCOPES = [GMAIL_READONLY_SCOPE, CALENDAR_READONLY_SCOPE]
+
+# Gmail accepts up to 100 calls per batch but throttles large batches;
+# 50 keeps us well inside the per-user concurrent request limit.
+BATCH_SIZE = 50
+
+# Messages carrying any of these labels are not part of the inbox view.
+SKIPPED_LABELS = {'DRAFT', 'SPAM', 'TRASH'}
+
+# How far ahead a full calendar sync expands recurring events.
+CALENDAR_SYNC_HORIZON_DAYS = 30
+
+# Calendars synced in parallel; each worker uses its own HTTP connection.
+CALENDAR_SYNC_WORKERS = 4
 
 class GoogleClient:
-    def __init__(self):
-        self.creds = None
-        if os.path.exists('token.json'):
-            self.creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'src/config/credentials.json', SCOPES)
-                self.creds = flow.run_local_server(port=0)
-            with open('token.json', 'w') as token:
-                token.write(self.creds.to_json())
-        self.gmail_service = build('gmail', 'v1', credentials=self.creds)
-        self.calendar_service = build('calendar', 'v3', credentials=self.creds)
+    def __init__(self, email_store=None, max_body_bytes=DEFAULT_MAX_BODY_BYTES,
+                 metadata_first=False, ranker=None, event_store=None, calendar_ids=None):
+        self._email_store = email_store
+        self._event_store = event_store
+        if calendar_ids is None:
+            calendar_ids = os.getenv('GOOGLE_CALENDAR_IDS', 'primary').split(',')
+        self.calendar_ids = [calendar_id.strip() for calendar_id in calendar_ids if calendar_id.strip()]
+        self.max_body_bytes = max_body_bytes
+        self.metadata_first = metadata_first
+        self.ranker = ranker or EmailRanker()
+
+    @property
+    def gmail_service(self):
+        return get_service('gmail', 'v1', SCOPES)
+
+    @property
+    def calendar_service(self):
+        return get_service('calendar', 'v3', SCOPES)
+
+    @property
+    def email_store(self):
+        if self._email_store is None:
+            self._email_store = GmailStore()
+        return self._email_store
+
+    @property
+    def event_store(self):
+        if self._event_store is None:
+            self._event_store = CalendarStore()
+        return self._event_store
 
     def get_todays_emails(self, max_results=20):
         """Fetch detailed emails received today."""
+        return list(self.iter_todays_emails(max_results=max_results))
+
+    def iter_todays_emails(self, max_results=None, page_size=BATCH_SIZE):
+        """
+        Stream today's emails page by page.
+
+        Each page of message IDs is fetched in a single batch request and
+        parsed emails are yielded as soon as that batch returns, so only one
+        page of messages is held in memory at a time.
+
+        Args:
+            max_results (int, optional): Upper bound on emails to yield, None for all
+            page_size (int): Messages listed and fetched per round-trip
+
+        Yields:
+            dict: Parsed email details
+        """
+        for message_ids in self._iter_message_id_pages(self._todays_query(), max_results, page_size):
+            details = self._fetch_message_details(message_ids, batch_size=page_size)
+            for message_id in message_ids:
+                if message_id in details:
+                    yield self._parse_message(details[message_id])
+
+    def get_synced_emails(self, max_results=20):
+        """Fetch today's emails from the local store after an incremental sync."""
+        return list(self.iter_synced_emails(max_results=max_results))
+
+    def iter_synced_emails(self, max_results=None):
+        """
+        Stream today's emails from the local store after an incremental sync.
+
+        Only messages added since the last saved historyId are downloaded,
+        so repeated runs during the day cost a single history() call when
+        nothing new has arrived.
+        """
+        self.sync_emails()
+        start = datetime.combine(datetime.now().date(), datetime.min.time())
+        end = start + timedelta(days=1)
+        return self.email_store.iter_emails_between(
+            int(start.timestamp() * 1000), int(end.timestamp() * 1000), limit=max_results
+        )
+
+    def _todays_query(self):
         today = datetime.now().date()
         after = today.strftime('%Y/%m/%d')
         before = (today + timedelta(days=1)).strftime('%Y/%m/%d')
-        query = f'after:{after} before:{before}'
-        results = self.gmail_service.users().messages().list(
-            userId='me', q=query, maxResults=max_results
-        ).execute()
-        messages = results.get('messages', [])
-        emails = []
-        for msg in messages:
-            msg_detail = self.gmail_service.users().messages().get(
-                userId='me', id=msg['id'], format='full'
+        return f'after:{after} before:{before}'
+
+    def _iter_message_id_pages(self, query, max_results=None, page_size=BATCH_SIZE):
+        """Yield lists of message IDs matching query, following nextPageToken."""
+        page_token = None
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            page_limit = page_size if remaining is None else min(page_size, remaining)
+            results = self.gmail_service.users().messages().list(
+                userId='me', q=query, maxResults=page_limit, pageToken=page_token
             ).execute()
-            headers = {h['name']: h['value'] for h in msg_detail['payload']['headers']}
-            body = ""
-            payload = msg_detail.get('payload', {})
-            if 'parts' in payload:
-                for part in payload['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        body = part['body'].get('data', '')
-                        break
-            elif payload.get('mimeType') == 'text/plain':
-                body = payload['body'].get('data', '')
-            if body:
-                try:
-                    body = base64.urlsafe_b64decode(body).decode('utf-8')
-                except Exception:
-                    pass
-            emails.append({
-                'id': msg['id'],
-                'subject': headers.get('Subject', ''),
-                'from': headers.get('From', ''),
-                'date': headers.get('Date', ''),
-                'snippet': msg_detail.get('snippet', ''),
-                'body': body
-            })
-        return emails
+            message_ids = [msg['id'] for msg in results.get('messages', [])]
+            if message_ids:
+                yield message_ids
+            if remaining is not None:
+                remaining -= len(message_ids)
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+    def sync_emails(self):
+        """Bring the local email store up to date, falling back to a full resync."""
+        history_id = self.email_store.get_history_id()
+        synced_today = self.email_store.get_state('sync_date') == datetime.now().date().isoformat()
+        if history_id and synced_today:
+            try:
+                self._sync_email_history(history_id)
+                return
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+                print("Gmail history ID expired, running full resync...")
+        self._full_email_sync()
+
+    def _full_email_sync(self):
+        """Download all of today's emails and record the current historyId."""
+        history_id = self.gmail_service.users().getProfile(userId='me').execute()['historyId']
+        today = datetime.now().date()
+        self.email_store.clear()
+        for message_ids in self._iter_message_id_pages(self._todays_query()):
+            self._store_messages(message_ids)
+        self.email_store.set_history_id(history_id)
+        self.email_store.set_state('sync_date', today.isoformat())
+
+    def _sync_email_history(self, history_id):
+        """Apply Gmail history records newer than history_id to the local store."""
+        added, deleted = [], set()
+        page_token = None
+        while True:
+            response = self.gmail_service.users().history().list(
+                userId='me',
+                startHistoryId=history_id,
+                historyTypes=['messageAdded', 'messageDeleted', 'labelAdded', 'labelRemoved'],
+                pageToken=page_token
+            ).execute()
+            for record in response.get('history', []):
+                for item in record.get('messagesAdded', []):
+                    message = item['message']
+                    if not SKIPPED_LABELS.intersection(message.get('labelIds', [])):
+                        added.append(message['id'])
+                for item in record.get('messagesDeleted', []):
+                    deleted.add(item['message']['id'])
+                for item in record.get('labelsAdded', []) + record.get('labelsRemoved', []):
+                    message = item['message']
+                    if SKIPPED_LABELS.intersection(message.get('labelIds', [])):
+                        deleted.add(message['id'])
+                    else:
+                        self.email_store.update_labels(message['id'], message.get('labelIds', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        added = [message_id for message_id in dict.fromkeys(added) if message_id not in deleted]
+        if deleted:
+            self.email_store.delete_emails(list(deleted))
+        self._store_messages(added)
+        start_of_day = datetime.combine(datetime.now().date(), datetime.min.time())
+        self.email_store.prune_before(int(start_of_day.timestamp() * 1000))
+        self.email_store.set_history_id(response['historyId'])
+
+    def _store_messages(self, message_ids):
+        details = self._fetch_message_details(message_ids)
+        self.email_store.upsert_emails([
+            (self._parse_message(detail), int(detail.get('internalDate', 0)), detail.get('labelIds', []))
+            for detail in details.values()
+        ])
+
+    def _fetch_message_details(self, message_ids, batch_size=BATCH_SIZE):
+        """
+        Fetch message resources, hydrating bodies only where they matter.
+
+        With metadata_first enabled, headers and snippets are fetched for
+        every message and the full payload only for messages the ranker
+        flags as important; the rest are parsed with an empty body.
+        """
+        if not self.metadata_first:
+            return self.batch_get_messages(message_ids, batch_size=batch_size)
+        details = self.batch_get_messages(
+            message_ids, format='metadata', batch_size=batch_size, metadata_headers=METADATA_HEADERS
+        )
+        important = [message_id for message_id, detail in details.items() if self.ranker.is_important(detail)]
+        details.update(self.batch_get_messages(important, batch_size=batch_size))
+        return details
+
+    def batch_get_messages(self, message_ids, format='full', batch_size=BATCH_SIZE, metadata_headers=None):
+        """
+        Fetch many Gmail messages using batched HTTP requests.
+
+        Args:
+            message_ids (list): Gmail message IDs to fetch
+            format (str): Gmail message format ('full', 'metadata', 'minimal')
+            batch_size (int): Number of messages per batch round-trip
+            metadata_headers (list, optional): Headers to return when format is 'metadata'
+
+        Returns:
+            dict: Raw message resources keyed by message ID. Messages that
+            failed to fetch are left out and reported on stdout.
+        """
+        details = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                print(f"Error fetching email {request_id}: {str(exception)}")
+                return
+            details[request_id] = response
+
+        for start in range(0, len(message_ids), batch_size):
+            batch = self.gmail_service.new_batch_http_request(callback=callback)
+            for message_id in message_ids[start:start + batch_size]:
+                batch.add(
+                    self.gmail_service.users().messages().get(
+                        userId='me', id=message_id, format=format,
+                        metadataHeaders=metadata_headers
+                    ),
+                    request_id=message_id
+                )
+            batch.execute()
+        return details
+
+    def _parse_message(self, msg_detail):
+        """Convert a raw Gmail message resource into an email dict."""
+        payload = msg_detail.get('payload', {})
+        headers = {h['name']: h['value'] for h in payload.get('headers', [])}
+        body = extract_body(payload, max_bytes=self.max_body_bytes)
+        return {
+            'id': msg_detail['id'],
+            'subject': headers.get('Subject', ''),
+            'from': headers.get('From', ''),
+            'date': headers.get('Date', ''),
+            'snippet': msg_detail.get('snippet', ''),
+            'body': body
+        }
 
     def get_todays_events(self):
         """Fetch detailed calendar events for today."""
-        today = datetime.utcnow().date()
-        start_of_day = datetime.combine(today, datetime.min.time()).isoformat() + 'Z'
-        end_of_day = datetime.combine(today, datetime.max.time()).isoformat() + 'Z'
-        events_result = self.calendar_service.events().list(
-            calendarId='primary',
-            timeMin=start_of_day,
-            timeMax=end_of_day,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-        events = events_result.get('items', [])
-        detailed_events = []
+        return self.get_upcoming_events(days_ahead=1)
+
+    def get_upcoming_events(self, days_ahead=1, timezone=None):
+        """
+        Fetch calendar events from the start of today through days_ahead days.
+
+        Args:
+            days_ahead (int): Number of calendar days to include, starting today
+            timezone (str, optional): IANA timezone for day boundaries,
+                defaults to USER_TIMEZONE or the local timezone
+
+        Returns:
+            list: Event dicts ordered by start time
+        """
+        user_tz = tz.gettz(timezone or os.getenv('USER_TIMEZONE')) or tz.tzlocal()
+        start = datetime.now(user_tz).replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=days_ahead)
+        return self.get_events(start, end)
+
+    def get_events(self, start, end, calendar_ids=None):
+        """
+        Serve events overlapping [start, end) from the local event store.
+
+        Every calendar is brought up to date concurrently with an
+        incremental syncToken request first; a full resync only happens
+        when no token is saved, the token has expired, or the window
+        reaches past the range the store was seeded with.
+
+        Args:
+            start (datetime): Timezone-aware window start
+            end (datetime): Timezone-aware window end
+            calendar_ids (list, optional): Calendars to read, defaults to self.calendar_ids
+
+        Returns:
+            list: Event dicts from all calendars merged into one timeline
+        """
+        calendar_ids = calendar_ids or self.calendar_ids
+        for calendar_id in calendar_ids:
+            horizon = self.event_store.get_horizon(calendar_id)
+            if horizon is not None and end.timestamp() > horizon:
+                self.event_store.clear_calendar(calendar_id)
+        self.sync_calendars(calendar_ids)
+        events = self.event_store.get_events_between(start.timestamp(), end.timestamp(), calendar_ids)
+        # The same meeting shows up once per calendar it was shared to.
+        seen, merged = set(), []
         for event in events:
-            detailed_events.append({
-                'id': event.get('id'),
-                'summary': event.get('summary', 'No Title'),
-                'description': event.get('description', ''),
-                'organizer': event.get('organizer', {}).get('email', ''),
-                'start': event.get('start', {}).get('dateTime', event.get('start', {}).get('date')),
-                'end': event.get('end', {}).get('dateTime', event.get('end', {}).get('date')),
-                'attendees': [att.get('email') for att in event.get('attendees', [])] if event.get('attendees') else [],
-                'location': event.get('location', ''),
-                'status': event.get('status', ''),
-                'hangoutLink': event.get('hangoutLink', ''),
-            })
-        return detailed_events
-
-client = GoogleClient()
\ No newline at end of file
+            if event['id'] not in seen:
+                seen.add(event['id'])
+                merged.append(event)
+        return merged
+
+    def sync_calendars(self, calendar_ids=None):
+        """Sync several calendars through a bounded worker pool; each worker uses its own connection."""
+        calendar_ids = calendar_ids or self.calendar_ids
+        if len(calendar_ids) == 1:
+            self.sync_events(calendar_ids[0])
+            return
+
+        def sync(calendar_id):
+            try:
+                self.sync_events(calendar_id)
+            except Exception as e:
+                print(f"Error syncing calendar {calendar_id}: {str(e)}")
+
+        with ThreadPoolExecutor(max_workers=min(CALENDAR_SYNC_WORKERS, len(calendar_ids))) as executor:
+            list(executor.map(sync, calendar_ids))
+
+    def sync_events(self, calendar_id='primary'):
+        """Bring the local event store up to date for one calendar."""
+        sync_token = self.event_store.get_sync_token(calendar_id)
+        params = {'calendarId': calendar_id, 'singleEvents': True, 'maxResults': 250}
+        if sync_token:
+            params['syncToken'] = sync_token
+            horizon = self.event_store.get_horizon(calendar_id)
+        else:
+            now = datetime.now(tz.UTC)
+            horizon = (now + timedelta(days=CALENDAR_SYNC_HORIZON_DAYS)).timestamp()
+            params['timeMin'] = (now - timedelta(days=1)).isoformat()
+            params['timeMax'] = datetime.fromtimestamp(horizon, tz.UTC).isoformat()
+            self.event_store.clear_calendar(calendar_id)
+
+        page_token = None
+        while True:
+            try:
+                response = self.calendar_service.events().list(pageToken=page_token, **params).execute()
+            except HttpError as e:
+                if e.resp.status == 410 and sync_token:
+                    print(f"Calendar sync token expired for {calendar_id}, running full resync...")
+                    self.event_store.clear_calendar(calendar_id)
+                    return self.sync_events(calendar_id)
+                raise
+            items = response.get('items', [])
+            cancelled = [event['id'] for event in items if event.get('status') == 'cancelled']
+            if cancelled:
+                self.event_store.delete_events(calendar_id, cancelled)
+            self.event_store.upsert_events(calendar_id, [
+                self._parse_event(event, calendar_id) for event in items if event.get('status') != 'cancelled'
+            ])
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        self.event_store.set_sync_token(calendar_id, response['nextSyncToken'], horizon)
+
+    def _parse_event(self, event, calendar_id='primary'):
+        """Convert a raw Calendar event into (event dict, start ts, end ts)."""
+        start = event.get('start', {})
+        end = event.get('end', {})
+        detailed_event = {
+            'id': event.get('id'),
+            'summary': event.get('summary', 'No Title'),
+            'description': event.get('description', ''),
+            'organizer': event.get('organizer', {}).get('email', ''),
+            'start': start.get('dateTime', start.get('date')),
+            'end': end.get('dateTime', end.get('date')),
+            'attendees': [att.get('email') for att in event.get('attendees', [])] if event.get('attendees') else [],
+            'location': event.get('location', ''),
+            'status': event.get('status', ''),
+            'hangoutLink': event.get('hangoutLink', ''),
+            'calendar': calendar_id,
+        }
+        return detailed_event, self._event_timestamp(start), self._event_timestamp(end)
+
+    def _event_timestamp(self, value):
+        if 'dateTime' in value:
+            return parser.isoparse(value['dateTime']).timestamp()
+        event_tz = tz.gettz(value.get('timeZone') or os.getenv('USER_TIMEZONE')) or tz.tzlocal()
+        return datetime.combine(parser.isoparse(value['date']).date(), datetime.min.time(), event_tz).timestamp()
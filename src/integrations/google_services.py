@@ -0,0 +1,85 @@
+"""
+Process-wide registry of Google API service objects
+"""
+import threading
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+from src.integrations.google_auth import credential_manager
+
+GMAIL_READONLY_SCOPE = 'https://www.googleapis.com/auth/gmail.readonly'
+GMAIL_FULL_SCOPE = 'https://mail.google.com/'
+CALENDAR_READONLY_SCOPE = 'https://www.googleapis.com/auth/calendar.readonly'
+CALENDAR_FULL_SCOPE = 'https://www.googleapis.com/auth/calendar'
+
+_lock = threading.Lock()
+_services = {}
+# Each thread executes requests on its own connection; httplib2.Http is not thread-safe.
+_local = threading.local()
+
+
+def get_credentials(scopes):
+    """
+    Return the shared credentials, ensuring they carry the requested scopes
+
+    Args:
+        scopes (list): OAuth scopes the credentials must carry
+
+    Returns:
+        Credentials: Valid user credentials managed by the credential manager
+    """
+    return credential_manager.get_credentials(scopes)
+
+
+def _thread_http(creds):
+    """Return the calling thread's authorized http, rebuilt when the credentials change"""
+    entry = getattr(_local, 'http', None)
+    if entry is None or entry[1] is not creds:
+        entry = (AuthorizedHttp(creds, http=httplib2.Http()), creds)
+        _local.http = entry
+    return entry[0]
+
+
+def _request_builder(creds):
+    """requestBuilder that binds every request to the executing thread's http"""
+    def build_request(http, *args, **kwargs):
+        return HttpRequest(_thread_http(creds), *args, **kwargs)
+    return build_request
+
+
+def get_service(name, version, scopes):
+    """
+    Return a shared API service object, building it lazily on first use
+
+    Services are built from the discovery documents bundled with
+    google-api-python-client, so no discovery HTTP request is made.
+    The service object is shared, but each request it creates is bound
+    to a per-thread httplib2 connection, so callers on different threads
+    can build and execute requests concurrently.
+
+    Args:
+        name (str): API name, e.g. 'gmail'
+        version (str): API version, e.g. 'v1'
+        scopes (list): OAuth scopes required by the caller
+
+    Returns:
+        Resource: The googleapiclient resource for the API
+    """
+    key = (name, version)
+    creds = get_credentials(scopes)
+    entry = _services.get(key)
+    if entry is not None and entry[1] is creds:
+        return entry[0]
+    with _lock:
+        entry = _services.get(key)
+        if entry is None or entry[1] is not creds:
+            service = build(
+                name, version, credentials=creds,
+                requestBuilder=_request_builder(creds),
+                static_discovery=True, cache_discovery=False
+            )
+            entry = (service, creds)
+            _services[key] = entry
+    return entry[0]
+
@@ -2,14 +2,28 @@ import os
 from dotenv import load_dotenv
 from jira import JIRA
 from datetime import datetime, timedelta
+from dateutil import parser, tz
+from src.storage.jira_store import JiraIssueStore
 
 load_dotenv()
 
+# Only the fields the summarizer reads; everything else stays on the server.
+SUMMARY_FIELDS = "summary,status,priority,assignee,duedate,description,updated"
+# Extra fields needed to describe what happened to an issue, fetched with expand=changelog.
+ACTIVITY_FIELDS = SUMMARY_FIELDS + ",created,comment"
+
+# Changelog fields worth surfacing in a briefing.
+TRACKED_CHANGE_FIELDS = ('status', 'assignee', 'duedate', 'priority', 'resolution')
+COMMENT_PREVIEW_CHARS = 200
+
+INVOLVEMENT_JQL = '(assignee = currentUser() OR reporter = currentUser() OR watcher = currentUser())'
+
 class JiraClient:
-    def __init__(self):
+    def __init__(self, issue_store=None):
         """
         Initialize the JIRA Client
         """
+        self._issue_store = issue_store
         self.jira_url = os.getenv("JIRA_URL")
         self.jira_username = os.getenv("JIRA_USERNAME")
         self.jira_api_token = os.getenv("JIRA_API_TOKEN")
@@ -31,6 +45,186 @@ class JiraClient:
             print(f"Failed to authenticate with JIRA: {str(e)}")
             return None
             
+    def get_recent_issues(self, days_back=7, fields=ACTIVITY_FIELDS, page_size=100, expand="changelog"):
+        """
+        Get every issue the user is involved in that changed recently, in one query.
+
+        Covers what get_assigned_issues, get_created_issues and
+        get_updated_issues return together: an issue created since the
+        cutoff has also been updated since then, so a single
+        watcher/assignee/reporter + updated condition is enough.
+
+        Args:
+            days_back (int): Number of days to look back
+            fields (str): Comma-separated issue fields to return
+            page_size (int): Issues requested per page
+            expand (str, optional): Extra issue sections to return, e.g. "changelog"
+
+        Returns:
+            list: jira.Issue objects, most recently updated first
+        """
+        if not self.client:
+            return []
+        since_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        jql = f'{INVOLVEMENT_JQL} AND updated >= "{since_date}" ORDER BY updated DESC'
+        try:
+            return self._search_all(jql, fields, page_size, expand)
+        except Exception as e:
+            print(f"Error fetching recent JIRA issues: {str(e)}")
+            return []
+
+    def _search_all(self, jql, fields=SUMMARY_FIELDS, page_size=100, expand=None):
+        """Run a JQL search and follow startAt paging until every issue is read."""
+        issues = []
+        start_at = 0
+        while True:
+            page = self.client.search_issues(
+                jql, startAt=start_at, maxResults=page_size, fields=fields, expand=expand
+            )
+            issues.extend(page)
+            start_at += len(page)
+            if not page or start_at >= page.total:
+                break
+        return issues
+
+    @property
+    def issue_store(self):
+        if self._issue_store is None:
+            self._issue_store = JiraIssueStore()
+        return self._issue_store
+
+    def get_synced_issues(self, days_back=7):
+        """
+        Get recently updated issues from the local store after an incremental sync.
+
+        Returns:
+            list: Issue records (dicts) updated within days_back, newest first,
+                with 'activity' and 'created_in_window' matched to the same window
+        """
+        self.sync_issues(days_back=days_back)
+        since = datetime.now(tz.UTC) - timedelta(days=days_back)
+        records = self.issue_store.get_issues_updated_since(since.timestamp())
+        for record in records:
+            record['activity'] = self._activity_since(record.get('activity', []), since)
+            record['created_in_window'] = self._created_since(record.get('created'), since)
+        return records
+
+    def sync_issues(self, days_back=7):
+        """
+        Pull issues updated since the stored watermark into the local store.
+
+        The first sync seeds the store with days_back of history; after
+        that only issues with updated past the watermark are requested.
+
+        Returns:
+            int: Number of issues whose stored fields changed
+        """
+        if not self.client:
+            return 0
+        watermark = self.issue_store.get_watermark()
+        window_start = datetime.now(tz.UTC) - timedelta(days=days_back)
+        if watermark is None:
+            since = window_start
+        else:
+            since = datetime.fromtimestamp(watermark, tz.UTC)
+        # JQL dates are minute-precision in the Jira user's own timezone.
+        since = since.astimezone(self._jira_timezone()).strftime("%Y/%m/%d %H:%M")
+        jql = f'{INVOLVEMENT_JQL} AND updated >= "{since}" ORDER BY updated ASC'
+        try:
+            issues = self._search_all(jql, ACTIVITY_FIELDS, expand="changelog")
+        except Exception as e:
+            print(f"Error syncing JIRA issues: {str(e)}")
+            return 0
+
+        changed = 0
+        newest = watermark or 0
+        for issue in issues:
+            record = self.to_record(issue, since=window_start)
+            updated_ts = parser.isoparse(record['updated']).timestamp() if record['updated'] else 0
+            if self.issue_store.upsert_issue(record, updated_ts):
+                changed += 1
+            newest = max(newest, updated_ts)
+        if newest:
+            self.issue_store.set_watermark(newest)
+        return changed
+
+    def to_record(self, issue, since=None):
+        """
+        Flatten a jira.Issue into a plain dict of the summarized fields.
+
+        When the issue was fetched with ACTIVITY_FIELDS and expand=changelog,
+        'activity' lists what happened to it at or after since, and
+        'created_in_window' tells whether the issue itself was created then.
+        """
+        fields = issue.raw.get('fields', {})
+        return {
+            'key': issue.key,
+            'summary': fields.get('summary'),
+            'status': (fields.get('status') or {}).get('name'),
+            'priority': (fields.get('priority') or {}).get('name'),
+            'assignee': (fields.get('assignee') or {}).get('displayName'),
+            'duedate': fields.get('duedate'),
+            'description': fields.get('description'),
+            'updated': fields.get('updated'),
+            'created': fields.get('created'),
+            'activity': self.get_activity(issue, since),
+            'created_in_window': self._created_since(fields.get('created'), since),
+        }
+
+    def get_activity(self, issue, since=None):
+        """
+        Describe an issue's creation, tracked field changes and comments as compact deltas.
+
+        Args:
+            issue (jira.Issue): Issue fetched with expand=changelog and the comment field
+            since (datetime, optional): Only include activity at or after this time
+
+        Returns:
+            list: Dicts with 'at' (ISO time) and 'text', oldest first
+        """
+        raw = issue.raw
+        fields = raw.get('fields', {})
+        activity = []
+        if fields.get('created'):
+            activity.append({'at': fields['created'], 'text': "created"})
+        for history in (raw.get('changelog') or {}).get('histories', []):
+            author = (history.get('author') or {}).get('displayName', 'Someone')
+            for item in history.get('items', []):
+                if item.get('field') not in TRACKED_CHANGE_FIELDS:
+                    continue
+                activity.append({
+                    'at': history.get('created'),
+                    'text': f"{item['field']}: {item.get('fromString') or 'none'} -> "
+                            f"{item.get('toString') or 'none'} by {author}",
+                })
+        for comment in (fields.get('comment') or {}).get('comments', []):
+            author = (comment.get('author') or {}).get('displayName', 'Someone')
+            body = " ".join(str(comment.get('body') or '').split())
+            if len(body) > COMMENT_PREVIEW_CHARS:
+                body = body[:COMMENT_PREVIEW_CHARS] + "..."
+            activity.append({'at': comment.get('created'), 'text': f"comment by {author}: {body}"})
+        return self._activity_since(activity, since)
+
+    def _activity_since(self, activity, since=None):
+        entries = [(parser.isoparse(entry['at']), entry) for entry in activity if entry.get('at')]
+        if since is not None:
+            entries = [(at, entry) for at, entry in entries if at >= since]
+        entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in entries]
+
+    def _created_since(self, created, since=None):
+        if not created:
+            return False
+        return since is None or parser.isoparse(created) >= since
+
+    def _jira_timezone(self):
+        if not hasattr(self, '_timezone'):
+            try:
+                self._timezone = tz.gettz(self.client.myself().get('timeZone')) or tz.UTC
+            except Exception:
+                self._timezone = tz.UTC
+        return self._timezone
+
     def get_assigned_issues(self, days_back=7):
         """Get assigned JIRA issues."""
         try:
@@ -41,6 +235,7 @@ class JiraClient:
             return issues
         except Exception as e:
             print(f"Error fetching JIRA issues: {str(e)}. Using mock data instead.")
+            return []
         
 
     def get_created_issues(self, days_back=7):
@@ -54,6 +249,7 @@ class JiraClient:
             return issues
         except Exception as e:
             print(f"Error fetching created JIRA issues: {str(e)}. Using mock data instead.")
+            return []
     
     def get_updated_issues(self, days_back=1):
         """Get issues updated recently that the user is watching or involved in."""
@@ -66,6 +262,7 @@ class JiraClient:
             return issues
         except Exception as e:
             print(f"Error fetching updated JIRA issues: {str(e)}. Using mock data instead.")
+            return []
             
     def get_issue_details(self, issue_key):
         """Get detailed information about a specific issue."""
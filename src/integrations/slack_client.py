@@ -1,56 +1,362 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
-from slack_sdk import WebClient
+from itertools import islice
 from slack_sdk.errors import SlackApiError
+from src.integrations.slack_scheduler import ScheduledWebClient
+from src.integrations.slack_user_directory import SlackUserDirectory
+from src.storage.slack_store import SlackMessageStore
+
+# conversations.history is a Tier 3 method (~50 calls/min); a small pool
+# reads a 40+ channel workspace in a couple of rounds without tripping it.
+HISTORY_WORKERS = 8
+
+# Messages buffered between the history workers and the consumer.
+MESSAGE_QUEUE_SIZE = 500
+
+# conversations.replies is also Tier 3; threads are expanded on a separate,
+# smaller pool shared by all channel workers.
+REPLY_WORKERS = 4
+
+# Thread parents collected before poll mode expands them as one batch.
+THREAD_BATCH_SIZE = 20
+
+# Days of synced messages kept in the local log.
+MESSAGE_RETENTION_DAYS = 7
 
 
 class SlackClient:
-    def __init__(self, bot_token):
-        self.client = WebClient(token=bot_token)
-        self.user_cache = {}
+    def __init__(self, bot_token, max_workers=HISTORY_WORKERS, message_store=None):
+        # Calls are paced per rate tier and retried on 429 by the shared scheduler.
+        self.client = ScheduledWebClient(token=bot_token)
+        self._message_store = message_store
+        self.max_workers = max_workers
+        self.users = SlackUserDirectory(self.client)
+        self._reply_executor = ThreadPoolExecutor(max_workers=REPLY_WORKERS)
+
+    @property
+    def message_store(self):
+        if self._message_store is None:
+            self._message_store = SlackMessageStore()
+        return self._message_store
 
     def get_user_name(self, user_id):
-        if user_id in self.user_cache:
-            return self.user_cache[user_id]
+        return self.users.get_name(user_id)
+
+    def get_synced_messages(self):
+        """
+        Return today's messages from the local log after an incremental sync.
+
+        Each channel is read only from its stored latest_ts watermark
+        onwards, and threads already in the log are re-checked only for
+        replies newer than the last one stored.
+        """
+        self.sync_messages()
+        return list(self.iter_stored_messages(self._start_of_day()))
+
+    def get_stored_messages(self):
+        """Return today's messages from the local log without calling Slack."""
+        return list(self.iter_stored_messages(self._start_of_day()))
+
+    def iter_stored_messages(self, oldest, latest=None):
+        """Stream messages from the local log in the summarizer's dict shape."""
+        for row in self.message_store.iter_messages(oldest, latest):
+            message = {
+                'ts': row['ts'],
+                'channel': row['channel_name'] or row['channel_id'],
+                'user': row['user'],
+                'text': row['text'],
+                'time': self._format_ts(row['ts'])
+            }
+            if row['reply_count']:
+                message['replies'] = self._stored_replies(row['channel_id'], row['ts'])
+            yield message
+
+    def sync_messages(self, max_channels=None):
+        """Pull messages newer than each joined channel's watermark into the local log."""
+        start = self._start_of_day()
         try:
-            user_info = self.client.users_info(user=user_id)
-            name = user_info['user']['real_name'] or user_info['user']['name']
-            self.user_cache[user_id] = name
-            return name
-        except Exception:
-            return user_id
-
-    def get_todays_messages(self, max_channels=5, max_messages=200):
+            joined_channels = list(islice(
+                (ch for ch in self.iter_channels() if ch.get('is_member', False)), max_channels
+            ))
+        except SlackApiError as e:
+            print(f"Error fetching channels: {e.response['error']}")
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(lambda channel: self._sync_channel(channel, start), joined_channels))
+        self.message_store.prune_before(start - MESSAGE_RETENTION_DAYS * 24 * 60 * 60)
+
+    def _sync_channel(self, channel, start):
+        watermark = self.message_store.get_watermark(channel['id'])
+        oldest = max(float(watermark), start) if watermark else start
+        newest = watermark
+        page, parents = [], []
+        try:
+            for msg in self.iter_channel_history(channel['id'], oldest, None):
+                if watermark and msg['ts'] == watermark:
+                    continue
+                if newest is None or float(msg['ts']) > float(newest):
+                    newest = msg['ts']
+                if msg.get('subtype') in ('channel_join', 'channel_leave'):
+                    continue
+                page.append(self._compact_message(msg))
+                if msg.get('reply_count'):
+                    parents.append(msg)
+                if len(page) >= MESSAGE_QUEUE_SIZE:
+                    self.message_store.upsert_messages(channel['id'], page)
+                    page = []
+        except SlackApiError as e:
+            print(f"Error syncing #{channel['name']}: {e.response['error']}")
+            newest = None
+        if page:
+            self.message_store.upsert_messages(channel['id'], page)
+        if newest:
+            self.message_store.set_watermark(channel['id'], channel['name'], newest)
+        self._sync_threads(channel['id'], parents, start)
+
+    def _sync_threads(self, channel_id, parents, start):
+        """
+        Expand new thread parents and re-check the day's known threads for late replies.
+
+        A reply to a thread synced earlier does not show up past the channel
+        watermark, so every thread already in the log is asked only for
+        replies newer than its stored latest_reply.
+        """
+        new_threads = {msg['ts'] for msg in parents}
+        futures = [
+            self._reply_executor.submit(self._sync_thread, channel_id, msg['ts'], msg.get('latest_reply'))
+            for msg in parents if self._is_thread_stale(channel_id, msg)
+        ]
+        futures.extend(
+            self._reply_executor.submit(
+                self._sync_thread, channel_id, row['thread_ts'], None, row['latest_reply'] or row['thread_ts']
+            )
+            for row in self.message_store.get_threads(channel_id, start)
+            if row['thread_ts'] not in new_threads
+        )
+        wait(futures)
+
+    def expand_threads(self, channel_id, parents):
+        """
+        Fetch replies for thread parents into the local log.
+
+        Threads whose latest_reply matches the one recorded at the last
+        expansion are skipped; the rest are fetched concurrently on the
+        shared reply pool.
+
+        Args:
+            channel_id (str): Channel the parents were posted in
+            parents (list): Raw Slack messages carrying thread metadata
+        """
+        futures = [
+            self._reply_executor.submit(self._sync_thread, channel_id, msg['ts'], msg.get('latest_reply'))
+            for msg in parents if self._is_thread_stale(channel_id, msg)
+        ]
+        wait(futures)
+
+    def _is_thread_stale(self, channel_id, msg):
+        """True for a thread parent whose latest_reply differs from the one last expanded."""
+        return bool(msg.get('reply_count')) and (
+            msg.get('latest_reply') != self.message_store.get_thread_latest_reply(channel_id, msg['ts'])
+        )
+
+    def _sync_thread(self, channel_id, thread_ts, latest_reply, oldest=None):
+        """
+        Store a thread's replies; with oldest, only those posted after it.
+
+        When re-checking from oldest, the thread's latest_reply and the
+        parent's reply stats are advanced from the replies found, and a
+        thread with no new replies is left untouched.
+        """
+        replies = []
+        try:
+            cursor = None
+            while True:
+                response = self.client.conversations_replies(
+                    channel=channel_id, ts=thread_ts, oldest=oldest, limit=200, cursor=cursor
+                )
+                replies.extend(
+                    self._compact_message(msg) for msg in response['messages']
+                    if msg['ts'] != thread_ts and (oldest is None or float(msg['ts']) > float(oldest))
+                )
+                cursor = response.get('response_metadata', {}).get('next_cursor')
+                if not response.get('has_more') or not cursor:
+                    break
+        except SlackApiError as e:
+            print(f"Error fetching thread {thread_ts}: {e.response['error']}")
+            return
+        if oldest is not None:
+            if not replies:
+                return
+            latest_reply = max((reply['ts'] for reply in replies), key=float)
+        self.message_store.upsert_messages(channel_id, replies)
+        self.message_store.set_thread_latest_reply(channel_id, thread_ts, latest_reply)
+        if oldest is not None:
+            self.message_store.refresh_thread_stats(channel_id, thread_ts)
+
+    def _stored_replies(self, channel_id, thread_ts):
+        """Compact form of a thread's replies for attaching to the parent."""
+        return [
+            {'ts': row['ts'], 'user': row['user'], 'text': row['text'], 'time': self._format_ts(row['ts'])}
+            for row in self.message_store.get_replies(channel_id, thread_ts)
+        ]
+
+    def _compact_message(self, msg):
+        """Reduce a raw Slack message to the fields kept in the local log."""
+        user_id = msg.get('user', 'unknown')
+        return {
+            'ts': msg['ts'],
+            'user': self.get_user_name(user_id) if user_id != 'unknown' else 'unknown',
+            'text': self.users.resolve_mentions(msg.get('text', '')),
+            'thread_ts': msg.get('thread_ts'),
+            'reply_count': msg.get('reply_count', 0),
+            'latest_reply': msg.get('latest_reply'),
+        }
+
+    def _start_of_day(self):
+        return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+    def _format_ts(self, ts):
+        return datetime.fromtimestamp(float(ts), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    def get_todays_messages(self, max_channels=None, max_messages=None):
+        return list(self.iter_todays_messages(max_channels=max_channels, max_messages=max_messages))
+
+    def iter_todays_messages(self, max_channels=None, max_messages=None):
+        """
+        Stream today's messages from every joined channel.
+
+        Channel histories are read concurrently and handed to the caller
+        through a bounded queue, so at most MESSAGE_QUEUE_SIZE messages are
+        buffered regardless of how busy the channels are.
+
+        Args:
+            max_channels (int, optional): Limit on joined channels to read
+            max_messages (int, optional): Limit on messages read per channel
+
+        Yields:
+            dict: Message details with channel, user, text and time
+        """
         today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
         oldest = today.timestamp()
         latest = (today + timedelta(days=1)).timestamp()
-        messages_summary = []
 
         try:
-            all_channels = self.client.conversations_list(types="public_channel,private_channel")['channels']
-            joined_channels = [ch for ch in all_channels if ch.get('is_member', False)][:max_channels]
-            for channel in joined_channels:
-                channel_id = channel['id']
-                channel_name = channel['name']
-                result = self.client.conversations_history(
-                    channel=channel_id,
-                    oldest=oldest,
-                    latest=latest,
-                    limit=max_messages
-                )
-                for msg in result['messages']:
-                    user_id = msg.get('user', 'unknown')
-                    user_name = self.get_user_name(user_id) if user_id != 'unknown' else 'unknown'
-                    text = msg.get('text', '')
-                    ts = float(msg['ts'])
-                    msg_time = datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-                    if 'has joined the channel' in text or 'has left the channel' in text:
-                        continue
-                    messages_summary.append({
-                        'channel': channel_name,
-                        'user': user_name,
-                        'text': text,
-                        'time': msg_time
-                    })
+            joined_channels = list(islice(
+                (ch for ch in self.iter_channels() if ch.get('is_member', False)), max_channels
+            ))
         except SlackApiError as e:
             print(f"Error fetching messages: {e.response['error']}")
-        return messages_summary
+            return
+
+        buffer = queue.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(channel):
+            for message in self._iter_channel_messages(channel, oldest, latest, max_messages):
+                if not put(message):
+                    return
+
+        def finish(futures):
+            wait(futures)
+            put(done)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = [executor.submit(produce, channel) for channel in joined_channels]
+        threading.Thread(target=finish, args=(futures,), daemon=True).start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def iter_channels(self, types="public_channel,private_channel", exclude_archived=True, page_size=200):
+        """Page through conversations.list, filtering archived channels and types server-side."""
+        cursor = None
+        while True:
+            response = self.client.conversations_list(
+                types=types, exclude_archived=exclude_archived, limit=page_size, cursor=cursor
+            )
+            yield from response['channels']
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+
+    def iter_channel_history(self, channel_id, oldest, latest, page_size=200):
+        """Page through conversations.history for a time window, newest first."""
+        cursor = None
+        while True:
+            response = self.client.conversations_history(
+                channel=channel_id, oldest=oldest, latest=latest, limit=page_size, cursor=cursor
+            )
+            yield from response['messages']
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not response.get('has_more') or not cursor:
+                break
+
+    def _iter_channel_messages(self, channel, oldest, latest, max_messages=None):
+        """
+        Read one channel's history for the window; errors only drop the rest of this channel.
+
+        Messages are yielded as they are read. Thread parents are held back
+        with the messages after them until THREAD_BATCH_SIZE parents (or
+        MESSAGE_QUEUE_SIZE messages) are pending, then expanded together
+        on the reply pool, so memory stays bounded and order is kept.
+        """
+        channel_name = channel['name']
+        pending, parents = [], []
+
+        def flush():
+            self.expand_threads(channel['id'], parents)
+            for msg, message in pending:
+                if msg.get('reply_count'):
+                    message['replies'] = self._stored_replies(channel['id'], msg['ts'])
+            batch = [message for _, message in pending]
+            pending.clear()
+            parents.clear()
+            return batch
+
+        try:
+            for msg in islice(self.iter_channel_history(channel['id'], oldest, latest), max_messages):
+                text = msg.get('text', '')
+                if 'has joined the channel' in text or 'has left the channel' in text:
+                    continue
+                message = self._format_message(msg, channel_name)
+                if msg.get('reply_count'):
+                    parents.append(msg)
+                elif not pending:
+                    yield message
+                    continue
+                pending.append((msg, message))
+                if len(parents) >= THREAD_BATCH_SIZE or len(pending) >= MESSAGE_QUEUE_SIZE:
+                    yield from flush()
+        except SlackApiError as e:
+            print(f"Error fetching messages for #{channel_name}: {e.response['error']}")
+        yield from flush()
+
+    def _format_message(self, msg, channel_name):
+        user_id = msg.get('user', 'unknown')
+        user_name = self.get_user_name(user_id) if user_id != 'unknown' else 'unknown'
+        return {
+            'ts': msg['ts'],
+            'channel': channel_name,
+            'user': user_name,
+            'text': self.users.resolve_mentions(msg.get('text', '')),
+            'time': self._format_ts(msg['ts'])
+        }
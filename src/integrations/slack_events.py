@@ -0,0 +1,74 @@
+from slack_sdk.errors import SlackApiError
+from src.storage.slack_store import SlackMessageStore
+from src.integrations.slack_user_directory import SlackUserDirectory
+
+# Message subtypes that carry no conversation content.
+IGNORED_SUBTYPES = {'channel_join', 'channel_leave', 'channel_topic', 'channel_purpose', 'message_replied'}
+
+
+class SlackEventIngestor:
+    """
+    Applies Slack Events API message events to the local message log, so
+    the briefing can read Slack without calling conversations.history.
+    """
+
+    def __init__(self, client, message_store=None, users=None):
+        self.client = client
+        self.message_store = message_store or SlackMessageStore()
+        self.users = users or SlackUserDirectory(client)
+
+    def ingest(self, event):
+        """
+        Store one event from an event_callback payload
+
+        Args:
+            event (dict): The payload's 'event' object
+
+        Returns:
+            bool: True if the event changed the local log
+        """
+        if event.get('type') != 'message':
+            return False
+        channel_id = event['channel']
+        subtype = event.get('subtype')
+
+        if subtype in IGNORED_SUBTYPES:
+            return False
+        if subtype == 'message_changed':
+            message = event['message']
+            self.message_store.update_text(channel_id, message['ts'], self.users.resolve_mentions(message.get('text', '')))
+            return True
+        if subtype == 'message_deleted':
+            self.message_store.delete_message(channel_id, event['deleted_ts'])
+            thread_ts = event.get('previous_message', {}).get('thread_ts')
+            if thread_ts:
+                self.message_store.refresh_thread_stats(channel_id, thread_ts)
+            return True
+        if event.get('hidden'):
+            return False
+
+        self._ensure_channel(channel_id)
+        user_id = event.get('user')
+        thread_ts = event.get('thread_ts')
+        self.message_store.upsert_messages(channel_id, [{
+            'ts': event['ts'],
+            'user': self.users.get_name(user_id) if user_id else event.get('username', 'unknown'),
+            'text': self.users.resolve_mentions(event.get('text', '')),
+            'thread_ts': thread_ts,
+        }])
+        if thread_ts and thread_ts != event['ts']:
+            self.message_store.refresh_thread_stats(channel_id, thread_ts)
+        else:
+            self.message_store.set_watermark(channel_id, self.message_store.get_channel_name(channel_id), event['ts'])
+        return True
+
+    def _ensure_channel(self, channel_id):
+        """Record the channel's name the first time it is seen."""
+        if self.message_store.get_channel_name(channel_id):
+            return
+        try:
+            name = self.client.conversations_info(channel=channel_id)['channel']['name']
+        except SlackApiError as e:
+            print(f"Error fetching channel {channel_id}: {e.response['error']}")
+            name = channel_id
+        self.message_store.set_channel_name(channel_id, name)
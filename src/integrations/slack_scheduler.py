@@ -0,0 +1,146 @@
+import time
+import random
+import threading
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+# Requests per minute allowed by Slack's Web API rate limit tiers.
+TIER_LIMITS = {1: 1, 2: 20, 3: 50, 4: 100}
+
+METHOD_TIERS = {
+    'auth.test': 4,
+    'chat.getPermalink': 4,
+    'chat.postMessage': 4,
+    'chat.scheduleMessage': 3,
+    'conversations.history': 3,
+    'conversations.info': 3,
+    'conversations.list': 2,
+    'conversations.replies': 3,
+    'users.info': 4,
+    'users.list': 2,
+}
+DEFAULT_TIER = 3
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed per-minute rate"""
+
+    def __init__(self, per_minute):
+        self.capacity = max(1, per_minute // 4)
+        self.rate = per_minute / 60.0
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def block(self, seconds):
+        """Stop handing out tokens for a while, e.g. after a 429"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+class SlackRequestScheduler:
+    """
+    Paces Slack Web API calls with per-method token buckets sized from
+    Slack's rate tiers. Calls that would exceed a tier wait in line
+    instead of failing, and 429 responses pause the method's bucket for
+    Retry-After plus jittered exponential backoff before retrying.
+    """
+
+    def __init__(self, max_retries=3, base_backoff=1.0):
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self._buckets = {}
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def call(self, method, func, *args, **kwargs):
+        """
+        Run a Slack API call once its method's bucket allows it
+
+        Args:
+            method (str): Slack API method name, e.g. 'conversations.history'
+            func (callable): Function performing the request
+
+        Returns:
+            The value returned by func
+        """
+        bucket = self._bucket(method)
+        metrics = self._metrics[method]
+        for attempt in range(self.max_retries + 1):
+            self._update(metrics, queued=1)
+            try:
+                bucket.acquire()
+            finally:
+                self._update(metrics, queued=-1)
+            self._update(metrics, in_flight=1, calls=1)
+            try:
+                return func(*args, **kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429 or attempt == self.max_retries:
+                    raise
+                self._update(metrics, throttled=1)
+                delay = self._retry_after(e.response) + random.uniform(0, self.base_backoff * 2 ** attempt)
+                bucket.block(delay)
+            finally:
+                self._update(metrics, in_flight=-1)
+
+    def get_metrics(self):
+        """Return queue depth, in-flight and throttle counters per method"""
+        with self._lock:
+            return {method: dict(counters) for method, counters in self._metrics.items()}
+
+    def _bucket(self, method):
+        bucket = self._buckets.get(method)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(method)
+                if bucket is None:
+                    tier = METHOD_TIERS.get(method, DEFAULT_TIER)
+                    bucket = TokenBucket(TIER_LIMITS[tier])
+                    self._metrics[method] = {'queued': 0, 'in_flight': 0, 'calls': 0, 'throttled': 0}
+                    self._buckets[method] = bucket
+        return bucket
+
+    def _update(self, metrics, **deltas):
+        with self._lock:
+            for key, delta in deltas.items():
+                metrics[key] += delta
+
+    def _retry_after(self, response):
+        headers = {key.lower(): value for key, value in (response.headers or {}).items()}
+        value = headers.get('retry-after', 1)
+        if isinstance(value, list):
+            value = value[0]
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 1.0
+
+
+scheduler = SlackRequestScheduler()
+
+
+class ScheduledWebClient(WebClient):
+    """WebClient whose every API call is routed through the shared scheduler"""
+
+    def __init__(self, *args, request_scheduler=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scheduler = request_scheduler or scheduler
+
+    def api_call(self, api_method, **kwargs):
+        return self.scheduler.call(api_method, super().api_call, api_method, **kwargs)
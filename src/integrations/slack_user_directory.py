@@ -0,0 +1,110 @@
+import re
+import time
+import threading
+from slack_sdk.errors import SlackApiError
+from src.storage.slack_user_store import SlackUserStore
+
+# Bulk-reload the workspace directory once a day.
+USER_CACHE_TTL_SECONDS = 24 * 60 * 60
+# After a failed bulk reload, serve the stored directory this long before retrying.
+REFRESH_RETRY_SECONDS = 5 * 60
+
+MENTION_PATTERN = re.compile(r"<@([UW][A-Z0-9]+)(?:\|[^>]*)?>")
+
+
+class SlackUserDirectory:
+    """
+    Workspace user directory loaded in bulk from users.list and persisted
+    on disk, so resolving a user ID is a dict lookup instead of a
+    users.info call.
+    """
+
+    def __init__(self, client, store=None, ttl=USER_CACHE_TTL_SECONDS):
+        self.client = client
+        self.store = store or SlackUserStore()
+        self.ttl = ttl
+        self._names = None
+        self._loaded_at = None
+        self._lock = threading.RLock()
+
+    def get_name(self, user_id):
+        """
+        Resolve a user ID to a display name
+
+        Args:
+            user_id (str): Slack user ID, e.g. U123ABC
+
+        Returns:
+            str: The user's real name or handle, or the ID if unknown
+        """
+        names = self._ensure_loaded()
+        if user_id in names:
+            return names[user_id]
+        return self._lookup(user_id)
+
+    def resolve_mentions(self, text):
+        """Replace <@U123> mentions in message text with @name"""
+        return MENTION_PATTERN.sub(lambda match: f"@{self.get_name(match.group(1))}", text)
+
+    def refresh(self):
+        """Bulk-load every workspace user with cursor pagination"""
+        names = {}
+        cursor = None
+        while True:
+            response = self.client.users_list(limit=200, cursor=cursor)
+            for member in response['members']:
+                names[member['id']] = self._display_name(member)
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+        self.store.replace_names(names)
+        with self._lock:
+            self._names = names
+            self._loaded_at = time.time()
+        return names
+
+    def _ensure_loaded(self):
+        # Fast path is a dict and a float in memory; the store is only read on (re)load.
+        names = self._names
+        if names is not None and not self._is_stale():
+            return names
+        with self._lock:
+            if self._names is not None and not self._is_stale():
+                return self._names
+            if self._names is None:
+                self._loaded_at = self.store.get_loaded_at()
+                if not self._is_stale():
+                    self._names = self.store.load_names()
+                    return self._names
+            try:
+                return self.refresh()
+            except SlackApiError as e:
+                print(f"Error loading Slack users: {e.response['error']}")
+                self._names = self.store.load_names()
+                self._loaded_at = time.time() - self.ttl + REFRESH_RETRY_SECONDS
+                return self._names
+
+    def _is_stale(self):
+        return self._loaded_at is None or time.time() - self._loaded_at > self.ttl
+
+    def _lookup(self, user_id):
+        """
+        Fall back to users.info for users who joined since the last bulk load.
+
+        IDs that cannot be resolved are remembered as themselves until the
+        next bulk load, so they cost one users.info call rather than one per message.
+        """
+        try:
+            user_info = self.client.users_info(user=user_id)
+            name = self._display_name(user_info['user'])
+        except Exception:
+            with self._lock:
+                self._names[user_id] = user_id
+            return user_id
+        with self._lock:
+            self._names[user_id] = name
+        self.store.upsert_name(user_id, name)
+        return name
+
+    def _display_name(self, user):
+        return user.get('real_name') or user.get('name') or user['id']
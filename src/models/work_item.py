@@ -0,0 +1,166 @@
+"""
+Compact, immutable representation of an item collected from any source
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class WorkItem:
+    """
+    A single email, calendar event, Slack message or JIRA issue.
+
+    Agents normalize raw integration payloads into WorkItems so that the
+    workflow state only carries the handful of fields the summarizers
+    read. Instances are slotted and immutable, which keeps them small,
+    hashable and cheap to pickle or convert with to_dict().
+
+    Fields:
+        source: 'email', 'event', 'slack' or 'jira'
+        id: Message ID, event ID, Slack ts or issue key
+        title: Subject, meeting title or issue summary
+        person: Sender, organizer, poster or assignee
+        timestamp: Sent, start, posted or last-updated time
+        end: Event end time
+        body: Body text, description or message text
+        snippet: Short preview text
+        status: Event or issue status
+        priority: Issue priority
+        due: Issue due date
+        location: Event location
+        link: Meeting link
+        container: Calendar ID or Slack channel name
+        participants: Event attendees
+        replies: Thread replies as WorkItems
+        changes: Short descriptions of what changed since the last sync
+        created_in_window: Whether the issue was created since the last sync
+    """
+
+    __slots__ = (
+        'source', 'id', 'title', 'person', 'timestamp', 'end', 'body', 'snippet',
+        'status', 'priority', 'due', 'location', 'link', 'container',
+        'participants', 'replies', 'changes', 'created_in_window',
+    )
+
+    def __init__(self, source: str, id: Optional[str] = None, title: Optional[str] = None,
+                 person: Optional[str] = None, timestamp: Optional[str] = None,
+                 end: Optional[str] = None, body: Optional[str] = None,
+                 snippet: Optional[str] = None, status: Optional[str] = None,
+                 priority: Optional[str] = None, due: Optional[str] = None,
+                 location: Optional[str] = None, link: Optional[str] = None,
+                 container: Optional[str] = None, participants: Iterable[str] = (),
+                 replies: Iterable["WorkItem"] = (), changes: Iterable[str] = (),
+                 created_in_window: bool = False):
+        values = dict(locals())
+        values.pop('self')
+        values['participants'] = tuple(participants or ())
+        values['replies'] = tuple(replies or ())
+        values['changes'] = tuple(changes or ())
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"WorkItem is immutable; cannot set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"WorkItem is immutable; cannot delete '{name}'")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __getstate__(self):
+        return self._values()
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, WorkItem) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        return f"WorkItem(source={self.source!r}, id={self.id!r}, title={self.title!r})"
+
+    def replace(self, **changes) -> "WorkItem":
+        """Return a copy with some fields changed"""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return WorkItem(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serializable dict without empty fields"""
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value in (None, ()) or value is False:
+                continue
+            if name == 'replies':
+                value = [reply.to_dict() for reply in value]
+            elif isinstance(value, tuple):
+                value = list(value)
+            result[name] = value
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkItem":
+        data = dict(data)
+        data['replies'] = [cls.from_dict(reply) for reply in data.get('replies', [])]
+        return cls(**data)
+
+    @classmethod
+    def from_email(cls, email: Dict[str, Any]) -> "WorkItem":
+        return cls(
+            source='email',
+            id=email.get('id'),
+            title=email.get('subject', ''),
+            person=email.get('from', ''),
+            timestamp=email.get('date', ''),
+            body=email.get('body', ''),
+            snippet=email.get('snippet', ''),
+        )
+
+    @classmethod
+    def from_event(cls, event: Dict[str, Any]) -> "WorkItem":
+        return cls(
+            source='event',
+            id=event.get('id'),
+            title=event.get('summary', 'No Title'),
+            person=event.get('organizer', ''),
+            timestamp=event.get('start'),
+            end=event.get('end'),
+            body=event.get('description', ''),
+            status=event.get('status', ''),
+            location=event.get('location', ''),
+            link=event.get('hangoutLink', ''),
+            container=event.get('calendar', 'primary'),
+            participants=event.get('attendees', []),
+        )
+
+    @classmethod
+    def from_slack_message(cls, message: Dict[str, Any]) -> "WorkItem":
+        return cls(
+            source='slack',
+            id=message.get('ts'),
+            person=message.get('user', 'unknown'),
+            timestamp=message.get('time'),
+            body=message.get('text', ''),
+            container=message.get('channel'),
+            replies=[cls.from_slack_message(reply) for reply in message.get('replies', [])],
+        )
+
+    @classmethod
+    def from_jira_record(cls, record: Dict[str, Any]) -> "WorkItem":
+        return cls(
+            source='jira',
+            id=record.get('key'),
+            title=record.get('summary'),
+            person=record.get('assignee'),
+            timestamp=record.get('updated'),
+            body=record.get('description'),
+            status=record.get('status'),
+            priority=record.get('priority'),
+            due=record.get('duedate'),
+            changes=[f"{entry['at'][:10]} {entry['text']}" for entry in record.get('activity') or []],
+            created_in_window=bool(record.get('created_in_window')),
+        )
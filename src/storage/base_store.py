@@ -0,0 +1,63 @@
+"""
+Base class for local SQLite-backed stores
+"""
+import os
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+DATA_DIR = os.getenv("DATA_DIR", "data")
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteStore:
+    """Shared connection handling and sync-state bookkeeping for local stores"""
+
+    SCHEMA = ""
+
+    def __init__(self, db_path):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(STATE_SCHEMA + self.SCHEMA)
+
+    def execute(self, sql, params=()):
+        """Run a single statement in its own transaction and return all rows"""
+        with self._lock, self.conn:
+            return self.conn.execute(sql, params).fetchall()
+
+    def executemany(self, sql, rows):
+        """Run a statement for every row in a single transaction"""
+        with self._lock, self.conn:
+            self.conn.executemany(sql, rows)
+
+    def get_state(self, key, default=None):
+        """Read a JSON-encoded value from the sync state table"""
+        rows = self.execute("SELECT value FROM sync_state WHERE key = ?", (key,))
+        return json.loads(rows[0]["value"]) if rows else default
+
+    def set_state(self, key, value):
+        """Write a JSON-encoded value to the sync state table"""
+        self.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, json.dumps(value))
+        )
+
+    def delete_state(self, key):
+        """Remove a value from the sync state table"""
+        self.execute("DELETE FROM sync_state WHERE key = ?", (key,))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
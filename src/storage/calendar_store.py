@@ -0,0 +1,86 @@
+"""
+Local store for synced Google Calendar events
+"""
+import os
+import json
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS idx_events_start ON events (start_ts);
+"""
+
+
+class CalendarStore(SQLiteStore):
+    """SQLite store holding expanded calendar events and per-calendar sync tokens"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "calendar.db"))
+
+    def get_sync_token(self, calendar_id):
+        return self.get_state(f"sync_token:{calendar_id}")
+
+    def set_sync_token(self, calendar_id, sync_token, horizon_ts):
+        """Save the nextSyncToken and the end of the time range it was seeded with"""
+        self.set_state(f"sync_token:{calendar_id}", sync_token)
+        self.set_state(f"horizon:{calendar_id}", horizon_ts)
+
+    def get_horizon(self, calendar_id):
+        return self.get_state(f"horizon:{calendar_id}")
+
+    def clear_calendar(self, calendar_id):
+        self.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+        self.delete_state(f"sync_token:{calendar_id}")
+        self.delete_state(f"horizon:{calendar_id}")
+
+    def upsert_events(self, calendar_id, events):
+        """
+        Insert or replace events for a calendar
+
+        Args:
+            calendar_id (str): Calendar the events belong to
+            events (list): Tuples of (event dict, start timestamp, end timestamp)
+        """
+        self.executemany(
+            "INSERT OR REPLACE INTO events (calendar_id, event_id, start_ts, end_ts, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (calendar_id, event['id'], start_ts, end_ts, json.dumps(event))
+                for event, start_ts, end_ts in events
+            ]
+        )
+
+    def delete_events(self, calendar_id, event_ids):
+        self.executemany(
+            "DELETE FROM events WHERE calendar_id = ? AND event_id = ?",
+            [(calendar_id, event_id) for event_id in event_ids]
+        )
+
+    def get_events_between(self, start_ts, end_ts, calendar_ids=None):
+        """
+        Read events overlapping a time window, ordered by start time
+
+        Args:
+            start_ts (float): Window start as an epoch timestamp
+            end_ts (float): Window end as an epoch timestamp
+            calendar_ids (list, optional): Restrict to these calendars
+
+        Returns:
+            list: Event dicts in the same shape as GoogleClient.get_todays_events
+        """
+        sql = "SELECT data FROM events WHERE start_ts < ? AND end_ts > ?"
+        params = [end_ts, start_ts]
+        if calendar_ids:
+            sql += f" AND calendar_id IN ({', '.join('?' for _ in calendar_ids)})"
+            params.extend(calendar_ids)
+        sql += " ORDER BY start_ts, end_ts"
+        return [json.loads(row["data"]) for row in self.execute(sql, params)]
@@ -0,0 +1,115 @@
+"""
+Local store for synced Gmail messages
+"""
+import os
+import json
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    internal_date INTEGER NOT NULL,
+    subject TEXT,
+    sender TEXT,
+    date TEXT,
+    snippet TEXT,
+    body TEXT,
+    labels TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_internal_date ON messages (internal_date);
+"""
+
+
+class GmailStore(SQLiteStore):
+    """SQLite store holding Gmail messages and the last synced historyId"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "gmail.db"))
+
+    def get_history_id(self):
+        return self.get_state("history_id")
+
+    def set_history_id(self, history_id):
+        self.set_state("history_id", str(history_id))
+
+    def upsert_emails(self, emails):
+        """
+        Insert or replace emails in the store
+
+        Args:
+            emails (list): Tuples of (email dict, internal date in ms, label IDs)
+        """
+        self.executemany(
+            "INSERT OR REPLACE INTO messages "
+            "(id, internal_date, subject, sender, date, snippet, body, labels) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    email['id'], internal_date, email.get('subject', ''),
+                    email.get('from', ''), email.get('date', ''),
+                    email.get('snippet', ''), email.get('body', ''),
+                    json.dumps(labels or [])
+                )
+                for email, internal_date, labels in emails
+            ]
+        )
+
+    def update_labels(self, message_id, labels):
+        self.execute(
+            "UPDATE messages SET labels = ? WHERE id = ?",
+            (json.dumps(labels or []), message_id)
+        )
+
+    def delete_emails(self, message_ids):
+        self.executemany("DELETE FROM messages WHERE id = ?", [(i,) for i in message_ids])
+
+    def prune_before(self, internal_date):
+        """Drop messages received before the given internal date (ms)"""
+        self.execute("DELETE FROM messages WHERE internal_date < ?", (internal_date,))
+
+    def clear(self):
+        self.execute("DELETE FROM messages")
+        self.delete_state("history_id")
+
+    def get_emails_between(self, start_ms, end_ms, limit=None):
+        """
+        Read stored emails received in a time range, newest first
+
+        Args:
+            start_ms (int): Range start as epoch milliseconds (inclusive)
+            end_ms (int): Range end as epoch milliseconds (exclusive)
+            limit (int, optional): Maximum number of emails to return
+
+        Returns:
+            list: Email dicts in the same shape as GoogleClient.get_todays_emails
+        """
+        return list(self.iter_emails_between(start_ms, end_ms, limit=limit))
+
+    def iter_emails_between(self, start_ms, end_ms, limit=None, page_size=50):
+        """Stream stored emails in a time range, newest first, one page at a time"""
+        cursor = (end_ms, "")
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_limit = page_size if remaining is None else min(page_size, remaining)
+            rows = self.execute(
+                "SELECT id, internal_date, subject, sender, date, snippet, body FROM messages "
+                "WHERE internal_date >= ? AND (internal_date < ? OR (internal_date = ? AND id < ?)) "
+                "ORDER BY internal_date DESC, id DESC LIMIT ?",
+                (start_ms, cursor[0], cursor[0], cursor[1], page_limit)
+            )
+            for row in rows:
+                yield {
+                    'id': row['id'],
+                    'subject': row['subject'],
+                    'from': row['sender'],
+                    'date': row['date'],
+                    'snippet': row['snippet'],
+                    'body': row['body']
+                }
+            if len(rows) < page_limit:
+                break
+            cursor = (rows[-1]['internal_date'], rows[-1]['id'])
+            if remaining is not None:
+                remaining -= len(rows)
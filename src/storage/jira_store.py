@@ -0,0 +1,111 @@
+"""
+Local store for synced Jira issues and their change history
+"""
+import os
+import json
+import time
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+# Stored with the issue but kept out of the field-change log; it is already a change list.
+UNLOGGED_FIELDS = ('activity', 'created', 'created_in_window')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    updated_ts REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_updated ON issues (updated_ts);
+CREATE TABLE IF NOT EXISTS issue_history (
+    key TEXT NOT NULL,
+    updated_ts REAL NOT NULL,
+    changes TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (key, updated_ts)
+);
+"""
+
+
+class JiraIssueStore(SQLiteStore):
+    """SQLite store keyed by issue key, with a per-issue log of field changes"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "jira.db"))
+
+    def get_watermark(self):
+        """Return the newest 'updated' epoch timestamp synced so far"""
+        return self.get_state("watermark")
+
+    def set_watermark(self, updated_ts):
+        self.set_state("watermark", updated_ts)
+
+    def get_issue(self, key):
+        rows = self.execute("SELECT data FROM issues WHERE key = ?", (key,))
+        return json.loads(rows[0]["data"]) if rows else None
+
+    def upsert_issue(self, record, updated_ts):
+        """
+        Insert or update an issue and log which fields changed
+
+        Fields in UNLOGGED_FIELDS are saved with the record but never logged.
+
+        Args:
+            record (dict): Flattened issue record keyed by field name
+            updated_ts (float): The issue's 'updated' time as an epoch timestamp
+
+        Returns:
+            dict: Changed fields mapped to [old, new]; empty if nothing changed
+        """
+        with self._lock:
+            previous = self.get_issue(record['key'])
+            if previous == record:
+                return {}
+            previous = previous or {}
+            changes = {
+                field: [previous.get(field), value]
+                for field, value in record.items()
+                if field != 'key' and field not in UNLOGGED_FIELDS and previous.get(field) != value
+            }
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO issues (key, updated_ts, data) VALUES (?, ?, ?)",
+                    (record['key'], updated_ts, json.dumps(record))
+                )
+                if changes:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO issue_history (key, updated_ts, changes, recorded_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (record['key'], updated_ts, json.dumps(changes), time.time())
+                    )
+            return changes
+
+    def get_issues_updated_since(self, since_ts):
+        """Return issue records updated at or after an epoch timestamp, newest first"""
+        rows = self.execute(
+            "SELECT data FROM issues WHERE updated_ts >= ? ORDER BY updated_ts DESC", (since_ts,)
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def get_changes_since(self, since_ts, key=None):
+        """
+        Return logged field changes recorded at or after an epoch timestamp
+
+        Args:
+            since_ts (float): Only changes to issues updated since this time
+            key (str, optional): Restrict to a single issue
+
+        Returns:
+            list: Dicts with key, updated_ts and the changed fields
+        """
+        sql = "SELECT key, updated_ts, changes FROM issue_history WHERE updated_ts >= ?"
+        params = [since_ts]
+        if key:
+            sql += " AND key = ?"
+            params.append(key)
+        sql += " ORDER BY updated_ts"
+        return [
+            {'key': row["key"], 'updated_ts': row["updated_ts"], 'changes': json.loads(row["changes"])}
+            for row in self.execute(sql, params)
+        ]
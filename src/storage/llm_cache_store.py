@@ -0,0 +1,83 @@
+"""
+Local store for cached LLM responses
+"""
+import os
+import time
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+"""
+
+
+class LLMCacheStore(SQLiteStore):
+    """SQLite store of model responses keyed by a content hash of the request"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "llm_cache.db"))
+
+    def get(self, key, max_age=None):
+        """
+        Return a cached response and mark it as recently used
+
+        Args:
+            key (str): Content hash of the request
+            max_age (float, optional): Seconds after which an entry is treated as expired
+
+        Returns:
+            str: The cached response, or None when missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            rows = self.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,))
+            if not rows:
+                return None
+            if max_age is not None and now - rows[0]["created_at"] > max_age:
+                self.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            return rows[0]["response"]
+
+    def put(self, key, model, response):
+        now = time.time()
+        self.execute(
+            "INSERT OR REPLACE INTO responses (key, model, response, created_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, model, response, now, now)
+        )
+
+    def evict(self, max_entries=None, max_age=None):
+        """
+        Drop expired entries, then the least recently used ones beyond max_entries
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        with self._lock, self.conn:
+            if max_age is not None:
+                removed += self.conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - max_age,)
+                ).rowcount
+            if max_entries is not None:
+                removed += self.conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY last_used DESC LIMIT ?)",
+                    (max_entries,)
+                ).rowcount
+        return removed
+
+    def count(self):
+        return self.execute("SELECT COUNT(*) AS n FROM responses")[0]["n"]
+
+    def clear(self):
+        self.execute("DELETE FROM responses")
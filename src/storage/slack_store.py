@@ -0,0 +1,170 @@
+"""
+Local log of synced Slack messages and per-channel watermarks
+"""
+import os
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    latest_ts TEXT
+);
+CREATE TABLE IF NOT EXISTS messages (
+    channel_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    user TEXT,
+    text TEXT,
+    thread_ts TEXT,
+    reply_count INTEGER DEFAULT 0,
+    latest_reply TEXT,
+    PRIMARY KEY (channel_id, ts)
+);
+CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages (CAST(ts AS REAL));
+CREATE INDEX IF NOT EXISTS idx_messages_thread ON messages (channel_id, thread_ts);
+CREATE TABLE IF NOT EXISTS threads (
+    channel_id TEXT NOT NULL,
+    thread_ts TEXT NOT NULL,
+    latest_reply TEXT,
+    PRIMARY KEY (channel_id, thread_ts)
+);
+"""
+
+
+class SlackMessageStore(SQLiteStore):
+    """SQLite store holding a compact log of Slack messages per channel"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "slack.db"))
+
+    def get_watermark(self, channel_id):
+        """Return the ts of the newest message already stored for a channel"""
+        rows = self.execute("SELECT latest_ts FROM channels WHERE id = ?", (channel_id,))
+        return rows[0]["latest_ts"] if rows else None
+
+    def set_watermark(self, channel_id, name, latest_ts):
+        self.execute(
+            "INSERT INTO channels (id, name, latest_ts) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name, "
+            "latest_ts = CASE WHEN latest_ts IS NULL OR CAST(excluded.latest_ts AS REAL) > CAST(latest_ts AS REAL) "
+            "THEN excluded.latest_ts ELSE latest_ts END",
+            (channel_id, name, latest_ts)
+        )
+
+    def set_channel_name(self, channel_id, name):
+        self.execute(
+            "INSERT INTO channels (id, name) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name",
+            (channel_id, name)
+        )
+
+    def get_channel_name(self, channel_id):
+        rows = self.execute("SELECT name FROM channels WHERE id = ?", (channel_id,))
+        return rows[0]["name"] if rows else None
+
+    def upsert_messages(self, channel_id, messages):
+        """
+        Insert or update messages for a channel
+
+        Messages without a reply_count (e.g. from the Events API) keep the
+        reply stats already stored for them, so a redelivered thread parent
+        does not lose its replies.
+
+        Args:
+            channel_id (str): Channel the messages were posted in
+            messages (list): Dicts with ts, user, text and optional thread fields
+        """
+        self.executemany(
+            "INSERT INTO messages "
+            "(channel_id, ts, user, text, thread_ts, reply_count, latest_reply) "
+            "VALUES (?, ?, ?, ?, ?, COALESCE(?, 0), ?) "
+            "ON CONFLICT(channel_id, ts) DO UPDATE SET "
+            "user = excluded.user, text = excluded.text, thread_ts = excluded.thread_ts, "
+            "reply_count = CASE WHEN ? IS NULL THEN messages.reply_count ELSE excluded.reply_count END, "
+            "latest_reply = CASE WHEN ? IS NULL THEN messages.latest_reply ELSE excluded.latest_reply END",
+            [
+                (
+                    channel_id, msg['ts'], msg.get('user', ''), msg.get('text', ''), msg.get('thread_ts'),
+                    msg.get('reply_count'), msg.get('latest_reply'), msg.get('reply_count'), msg.get('reply_count')
+                )
+                for msg in messages
+            ]
+        )
+
+    def get_thread_latest_reply(self, channel_id, thread_ts):
+        """Return the latest_reply ts recorded when a thread was last expanded"""
+        rows = self.execute(
+            "SELECT latest_reply FROM threads WHERE channel_id = ? AND thread_ts = ?",
+            (channel_id, thread_ts)
+        )
+        return rows[0]["latest_reply"] if rows else None
+
+    def set_thread_latest_reply(self, channel_id, thread_ts, latest_reply):
+        self.execute(
+            "INSERT OR REPLACE INTO threads (channel_id, thread_ts, latest_reply) VALUES (?, ?, ?)",
+            (channel_id, thread_ts, latest_reply)
+        )
+
+    def get_threads(self, channel_id, oldest):
+        """Return expanded threads in a channel started at or after an epoch timestamp"""
+        return self.execute(
+            "SELECT thread_ts, latest_reply FROM threads WHERE channel_id = ? AND CAST(thread_ts AS REAL) >= ?",
+            (channel_id, oldest)
+        )
+
+    def refresh_thread_stats(self, channel_id, thread_ts):
+        """Recompute a parent's reply_count and latest_reply from the stored replies"""
+        self.execute(
+            "UPDATE messages SET "
+            "reply_count = (SELECT COUNT(*) FROM messages r WHERE r.channel_id = ? AND r.thread_ts = ? AND r.ts != r.thread_ts), "
+            "latest_reply = (SELECT r.ts FROM messages r WHERE r.channel_id = ? AND r.thread_ts = ? AND r.ts != r.thread_ts "
+            "ORDER BY CAST(r.ts AS REAL) DESC LIMIT 1) "
+            "WHERE channel_id = ? AND ts = ?",
+            (channel_id, thread_ts, channel_id, thread_ts, channel_id, thread_ts)
+        )
+
+    def update_text(self, channel_id, ts, text):
+        self.execute("UPDATE messages SET text = ? WHERE channel_id = ? AND ts = ?", (text, channel_id, ts))
+
+    def delete_message(self, channel_id, ts):
+        self.execute("DELETE FROM messages WHERE channel_id = ? AND ts = ?", (channel_id, ts))
+
+    def get_replies(self, channel_id, thread_ts):
+        """Return stored replies in a thread, oldest first, excluding the parent"""
+        return self.execute(
+            "SELECT * FROM messages WHERE channel_id = ? AND thread_ts = ? AND ts != thread_ts "
+            "ORDER BY CAST(ts AS REAL)",
+            (channel_id, thread_ts)
+        )
+
+    def iter_messages(self, oldest, latest=None):
+        """
+        Stream stored top-level messages posted in a time window, oldest first
+
+        Args:
+            oldest (float): Window start as an epoch timestamp
+            latest (float, optional): Window end as an epoch timestamp
+
+        Yields:
+            sqlite3.Row: Message rows joined with their channel name
+        """
+        sql = (
+            "SELECT m.*, c.name AS channel_name FROM messages m "
+            "LEFT JOIN channels c ON c.id = m.channel_id "
+            "WHERE CAST(m.ts AS REAL) >= ? AND (m.thread_ts IS NULL OR m.thread_ts = m.ts)"
+        )
+        params = [oldest]
+        if latest is not None:
+            sql += " AND CAST(m.ts AS REAL) < ?"
+            params.append(latest)
+        sql += " ORDER BY CAST(m.ts AS REAL)"
+        yield from self.execute(sql, params)
+
+    def prune_before(self, oldest):
+        """Drop messages and threads started before an epoch timestamp"""
+        self.execute(
+            "DELETE FROM messages WHERE CAST(COALESCE(thread_ts, ts) AS REAL) < ?", (oldest,)
+        )
+        self.execute("DELETE FROM threads WHERE CAST(thread_ts AS REAL) < ?", (oldest,))
@@ -0,0 +1,39 @@
+"""
+Local store for the Slack workspace user directory
+"""
+import os
+import time
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+"""
+
+
+class SlackUserStore(SQLiteStore):
+    """SQLite store mapping Slack user IDs to display names"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "slack_users.db"))
+
+    def get_loaded_at(self):
+        return self.get_state("loaded_at")
+
+    def load_names(self):
+        """Return every stored user as a {user_id: name} dict"""
+        return {row["id"]: row["name"] for row in self.execute("SELECT id, name FROM users")}
+
+    def replace_names(self, names):
+        """Replace the whole directory after a bulk users.list load"""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM users")
+            self.conn.executemany("INSERT INTO users (id, name) VALUES (?, ?)", names.items())
+        self.set_state("loaded_at", time.time())
+
+    def upsert_name(self, user_id, name):
+        self.execute("INSERT OR REPLACE INTO users (id, name) VALUES (?, ?)", (user_id, name))
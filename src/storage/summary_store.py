@@ -0,0 +1,61 @@
+"""
+Local store for each source's latest summary and the items it covered
+"""
+import os
+import json
+import time
+from src.storage.base_store import SQLiteStore, DATA_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    source TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    items TEXT NOT NULL,
+    increments INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SummaryStore(SQLiteStore):
+    """SQLite store holding one summary per source"""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, db_path=None):
+        super().__init__(db_path or os.path.join(DATA_DIR, "summaries.db"))
+
+    def get_summary(self, source):
+        """
+        Return the stored summary for a source
+
+        Returns:
+            dict: day, summary, items ({item key: [fingerprint, label]}) and
+                increments merged since the last full rebuild, or None
+        """
+        rows = self.execute(
+            "SELECT day, summary, items, increments FROM summaries WHERE source = ?", (source,)
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        return {
+            'day': row["day"],
+            'summary': row["summary"],
+            'items': json.loads(row["items"]),
+            'increments': row["increments"],
+        }
+
+    def save_summary(self, source, day, summary, items, increments):
+        self.execute(
+            "INSERT OR REPLACE INTO summaries (source, day, summary, items, increments, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (source, day, summary, json.dumps(items), increments, time.time())
+        )
+
+    def clear(self, source=None):
+        if source:
+            self.execute("DELETE FROM summaries WHERE source = ?", (source,))
+        else:
+            self.execute("DELETE FROM summaries")
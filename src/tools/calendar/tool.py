@@ -4,10 +4,7 @@ Calendar tool implementation
 import os
 import logging
 from langchain_google_community import CalendarToolkit
-from langchain_google_community.calendar.utils import (
-    build_resource_service as build_calendar_service,
-    get_google_credentials as get_calendar_credentials,
-)
+from src.integrations.google_services import get_service, CALENDAR_FULL_SCOPE
 from typing import List
 from langchain_core.tools import BaseTool
 from src.models.api_models import ToolStatus
@@ -26,12 +23,7 @@ class CalendarTool:
     def _initialize_tools(self):
         """Initialize Calendar tools with proper error handling"""
         try:
-            calendar_credentials = get_calendar_credentials(
-                token_file="token.json",
-                scopes=["https://www.googleapis.com/auth/calendar"],
-                client_secrets_file="src/config/credentials.json",
-            )
-            calendar_resource = build_calendar_service(credentials=calendar_credentials)
+            calendar_resource = get_service("calendar", "v3", [CALENDAR_FULL_SCOPE])
             self.toolkit = CalendarToolkit(api_resource=calendar_resource)
             self.tools = self.toolkit.get_tools()
             self.status = ToolStatus(name="calendar", status="enabled")
@@ -4,10 +4,7 @@ Gmail tool implementation
 import os
 import logging
 from langchain_google_community import GmailToolkit
-from langchain_google_community.gmail.utils import (
-    build_resource_service as build_gmail_service,
-    get_gmail_credentials,
-)
+from src.integrations.google_services import get_service, GMAIL_FULL_SCOPE
 from typing import List
 from langchain_core.tools import BaseTool
 from src.models.api_models import ToolStatus
@@ -26,12 +23,7 @@ class GmailTool:
     def _initialize_tools(self):
         """Initialize Gmail tools with proper error handling"""
         try:
-            gmail_credentials = get_gmail_credentials(
-                token_file="token.json",
-                scopes=["https://mail.google.com/"],
-                client_secrets_file="src/config/credentials.json",
-            )
-            gmail_resource = build_gmail_service(credentials=gmail_credentials)
+            gmail_resource = get_service("gmail", "v1", [GMAIL_FULL_SCOPE])
             self.toolkit = GmailToolkit(api_resource=gmail_resource)
             self.tools = self.toolkit.get_tools()
             self.status = ToolStatus(name="gmail", status="enabled")
@@ -4,6 +4,7 @@ Slack tool implementation
 import os
 import logging
 from langchain_community.agent_toolkits import SlackToolkit
+from src.integrations.slack_scheduler import ScheduledWebClient
 from typing import List
 from langchain_core.tools import BaseTool
 from src.models.api_models import ToolStatus
@@ -22,7 +23,8 @@ class SlackTool:
     def _initialize_tools(self):
         """Initialize Slack tools with proper error handling"""
         try:
-            self.toolkit = SlackToolkit()
+            token = os.environ.get("SLACK_USER_TOKEN") or os.environ.get("SLACK_BOT_TOKEN")
+            self.toolkit = SlackToolkit(client=ScheduledWebClient(token=token))
             self.tools = self.toolkit.get_tools()
             self.status = ToolStatus(name="slack", status="enabled")
             logger.info(f"Slack tools initialized: {len(self.tools)} tools - {[tool.name for tool in self.tools]}")